@@ -5,7 +5,7 @@
 * LICENSE: Mozilla Public License 2.0
 """
 # Standard Library Imports
-import os
+from pathlib import Path
 import shutil
 
 # Third Party Imports
@@ -13,9 +13,6 @@ import click
 from loguru import logger
 
 # Local Imports
-from omnitils.api.github import (
-    gh_download_repository,
-    gh_download_directory_files)
 from omnitils.files import DisposableDir
 
 """
@@ -26,6 +23,7 @@ from omnitils.files import DisposableDir
 @click.command()
 def test_gh_download_repository():
     """Tests the use of `omnitils.fetch.gh_download_repository`."""
+    from omnitils.api.github import gh_download_repository
 
     # Setup test directory
     with DisposableDir() as temp_dir:
@@ -53,6 +51,7 @@ def test_gh_download_repository():
 @click.command()
 def test_gh_download_directory_files():
     """Tests the user of `omnitils.fetch.gh_download_directory_files`."""
+    from omnitils.api.github import gh_download_directory_files
 
     # Setup test directory
     with DisposableDir() as temp_dir:
@@ -66,7 +65,8 @@ def test_gh_download_directory_files():
         try:
             # Check repo directory
             assert len(files_downloaded) > 0
-            [os.remove(n) for n in files_downloaded]
+            for n in files_downloaded:
+                Path(n).unlink(missing_ok=True)
             logger.success('Test passed!')
         except AssertionError:
             return logger.error('No files downloaded from repo!')
@@ -6,8 +6,6 @@
 """
 # Standard Library Imports
 from contextlib import suppress
-from dataclasses import dataclass
-import os
 from pathlib import Path
 import re
 import shutil
@@ -29,17 +27,16 @@ from omnitils.files import mkdir_full_perms, get_temporary_file, dump_data_file
 from omnitils.strings import decode_url
 
 """
-* Enums
+* Constants
 """
 
-
-@dataclass
-class GoogleReg:
-    """Defined Google URL regex patterns."""
-    URL: re.Pattern = re.compile(r'"downloadUrl":"([^"]+)')
-    FORM: re.Pattern = re.compile(r'id="download-form" action="(.+?)"')
-    EXPORT: re.Pattern = re.compile(r'href="(/uc\?export=download[^"]+)')
-    ERROR: re.Pattern = re.compile(r'<p class="uc-error-subcaption">(.*)</p>')
+# Google Drive confirmation page regex, each alternative captures a named group. Alternatives are
+# lookaheads so a match for one pattern never consumes the text of an overlapping match for another.
+_RE_CONFIRMATION = re.compile(
+    r'(?=href="(?P<export>/uc\?export=download[^"\n]+))'
+    r'|(?=id="download-form" action="(?P<form>.+?)")'
+    r'|(?="downloadUrl":"(?P<url>[^"\n]+))'
+    r'|(?=<p class="uc-error-subcaption">(?P<error>.*)</p>)')
 
 
 """
@@ -69,19 +66,25 @@ def gdrive_get_confirmation_url(contents: str) -> yarl.URL:
     Returns:
         URL object targeting the hosted file.
     """
-    for line in contents.splitlines():
-        if m := GoogleReg.EXPORT.search(line):
-            # Google Docs URL
-            return decode_url(f'https://docs.google.com{m.groups()[0]}')
-        if m := GoogleReg.FORM.search(line):
-            # Download URL from Form
-            return decode_url(m.groups()[0])
-        if m := GoogleReg.URL.search(line):
-            # Download URL from JSON
-            return decode_url(m.groups()[0])
-        if m := GoogleReg.ERROR.search(line):
-            # Error Returned
-            raise OSError(m.groups()[0])
+    # Keep the first match of each pattern, an export link outranks everything else
+    found: dict[str, str] = {}
+    for m in _RE_CONFIRMATION.finditer(contents):
+        if (match := m.lastgroup) and match not in found:
+            found[match] = m.group(match)
+            if match == 'export':
+                break
+    if 'export' in found:
+        # Google Docs URL
+        return decode_url(f'https://docs.google.com{found["export"]}')
+    if 'form' in found:
+        # Download URL from Form
+        return decode_url(found['form'])
+    if 'url' in found:
+        # Download URL from JSON
+        return decode_url(found['url'])
+    if 'error' in found:
+        # Error Returned
+        raise OSError(found['error'])
     raise OSError(
         "Google Drive file has been made private or has reached its daily request limit.")
 
@@ -90,7 +93,8 @@ def gdrive_process_url(
     url: Union[str, yarl.URL],
     sess: Optional[Session] = None,
     headers: Optional[dict] = None,
-    path_cookies: Optional[Path] = None
+    path_cookies: Optional[Path] = None,
+    max_redirects: int = 5
 ) -> Optional[tuple[Session, Response]]:
     """Tests a Gdrive file URL to ensure it is the absolute download URL. If it isn't,
         attempt to redirect to the absolute URL based on Google Drive confirmation. Return a valid session and
@@ -101,35 +105,41 @@ def gdrive_process_url(
         sess: Session object to use for requests, create one if not provided.
         headers: Headers to pass when creating a new Session object, if provided.
         path_cookies: Path to cookies file to load saved cookies from, will skip cookies if not provided.
+        max_redirects: Maximum number of confirmation pages to follow before giving up, defaults to 5.
 
     Returns:
         A tuple containing the Session object and Response from correct URL, if successful. Returns None if
             a working URL couldn't be established or Google Drive denies access to the file.
     """
-    # Ensure session object, then initialize request
+    # Ensure session object
     if not sess:
         sess = get_new_session(
             headers=headers, stream=True, path_cookies=path_cookies)
-    res = sess.get(url)
 
-    # Update cookies
-    if path_cookies:
-        gdrive_update_cookies(sess, path_cookies)
+    # Follow confirmation redirects until the file is reached
+    cookies = None
+    for _ in range(max_redirects + 1):
+        res = sess.get(url)
 
-    # Is this the right file?
-    if "Content-Disposition" in res.headers:
-        return sess, res
+        # Update cookies
+        if path_cookies:
+            cookies = gdrive_update_cookies(sess, path_cookies, previous=cookies)
 
-    # Try again with updated URL from confirmation
-    try:
-        return gdrive_process_url(
-            url=gdrive_get_confirmation_url(res.text),
-            sess=sess,
-            headers=headers,
-            path_cookies=path_cookies)
-    except Exception as e:
-        logger.error(e), res.close(), sess.close()
-        return logger.error(f'Google Drive denied access to the file!')
+        # Is this the right file?
+        if "Content-Disposition" in res.headers:
+            return sess, res
+
+        # Try again with updated URL from confirmation
+        try:
+            url = gdrive_get_confirmation_url(res.text)
+        except Exception as e:
+            logger.error(e), res.close(), sess.close()
+            return logger.error(f'Google Drive denied access to the file!')
+        res.close()
+
+    # Too many confirmation redirects
+    sess.close()
+    return logger.error('Google Drive redirected too many times!')
 
 
 """
@@ -137,19 +147,27 @@ def gdrive_process_url(
 """
 
 
-def gdrive_update_cookies(sess: Session, path_cookies: Path) -> None:
+def gdrive_update_cookies(
+    sess: Session,
+    path_cookies: Path,
+    previous: Optional[list[tuple[str, str]]] = None
+) -> list[tuple[str, str]]:
     """Update cookies file using Gdrive session.
 
     Args:
         sess: Session object to pull cookies from.
         path_cookies: Path to local cookies file.
+        previous: Cookies returned by a previous call, skips writing the file if they haven't changed.
+
+    Returns:
+        Cookies saved to the cookies file.
     """
-    dump_data_file(
-        obj=[
-            (k, v) for k, v in sess.cookies.items()
-            if not k.startswith("download_warning_")
-        ],
-        path=path_cookies)
+    cookies = [
+        (k, v) for k, v in sess.cookies.items()
+        if not k.startswith("download_warning_")]
+    if cookies != previous:
+        dump_data_file(obj=cookies, path=path_cookies)
+    return cookies
 
 
 """
@@ -219,7 +237,7 @@ def gdrive_download_file(
         headers: Headers object to pass with request, uses default if not provided.
         path_cookies: Path to cookies file, don't use cookies if not provided.
         allow_resume: Whether to allow resuming a previous download.
-        chunk_size: Chunk size in bytes when downloading the file with `iter_content`. Defaults to 8MB.
+        chunk_size: Chunk size in bytes when downloading the file with `iter_content`. Defaults to 1MB.
 
     Returns:
         Path to the downloaded file if successful, otherwise None.
@@ -263,7 +281,7 @@ def gdrive_download_file(
             f'{path.name} | {url}')
 
     # Rename temporary file
-    if not os.path.samefile(file, path):
+    if file.resolve() != path.resolve():
         shutil.move(file, path)
 
     # Close session and return
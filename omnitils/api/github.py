@@ -5,14 +5,19 @@
 * LICENSE: Mozilla Public License 2.0
 """
 # Standard Library Imports
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import json
 import os
 import zipfile
 from logging import getLogger
 from pathlib import Path
+from tempfile import SpooledTemporaryFile
 import requests
 from typing import Optional, Union, Callable
 
 # Third Party Imports
+from requests.adapters import HTTPAdapter
 import yarl
 from backoff import on_exception, expo
 from ratelimit import RateLimitDecorator, sleep_and_retry
@@ -26,6 +31,17 @@ from omnitils.fetch._core import request_header_default, chunk_size_default
 github_rate_limit = RateLimitDecorator(calls=60, period=3600)
 github_rate_limit_authenticated = RateLimitDecorator(calls=7, period=5)
 
+# Shared session to pool connections across GitHub requests
+gh_session = requests.Session()
+gh_session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+# Max size of a repository archive held in memory before spilling to disk
+spool_size_default = 1024 * 1024 * 64
+
+# Cached API responses used for conditional requests, maps (url, token) to (etag, content)
+gh_response_cache: dict[tuple[str, str | None], tuple[str, bytes]] = {}
+gh_response_cache_size = 256
+
 """
 * Handlers
 """
@@ -85,6 +101,10 @@ def gh_get_data_json(
 ) -> dict | list | tuple:
     """Request a manifest file and return its JSON loaded data.
 
+    Notes:
+        Responses carrying an ETag are cached, subsequent requests for the same URL are sent as
+            conditional requests and reuse the cached data if GitHub reports it is unchanged.
+
     Args:
         url: URL to the data file resource hosted on GitHub.
         header: Header object to pass with request, uses default if not provided.
@@ -97,17 +117,54 @@ def gh_get_data_json(
     """
     # Use provided header or choose one
     handler = handler or (
-        gh_request_handler if auth_token
-        else gh_request_handler_authenticated)
+        gh_request_handler_authenticated if auth_token
+        else gh_request_handler)
 
     @handler
     def _make_request(_url, _header, _token):
-        with requests.get(_url, headers=gh_get_header(_header, _token)) as r:
+        _key = (str(_url), _token)
+        _header = gh_get_header(_header, _token)
+
+        # Ask GitHub to skip the body if our cached copy is still current
+        if _cached := gh_response_cache.get(_key):
+            _header = {**_header, 'If-None-Match': _cached[0]}
+
+        with gh_session.get(_url, headers=_header) as r:
+            if _cached and r.status_code == 304:
+                return json.loads(_cached[1])
             r.raise_for_status()
+
+            # Cache the response if it can be revalidated later
+            if etag := r.headers.get('ETag'):
+                gh_response_cache[_key] = (etag, r.content)
+                if len(gh_response_cache) > gh_response_cache_size:
+                    gh_response_cache.pop(next(iter(gh_response_cache)), None)
             return r.json()
     return _make_request(url, header, auth_token)
 
 
+"""
+* File Utilities
+"""
+
+
+def gh_get_blob_sha(path: Path, chunk_size: int = chunk_size_default) -> str:
+    """Calculate the git blob SHA-1 of a local file, matching the `sha` GitHub reports for repository files.
+
+    Args:
+        path: Path to the file.
+        chunk_size: Max bytes to read from the file on each iteration.
+
+    Returns:
+        The git blob SHA-1 of this file.
+    """
+    with open(path, 'rb') as f:
+        sha1_hash = hashlib.sha1(b'blob %d\0' % os.fstat(f.fileno()).st_size)
+        while chunk := f.read(chunk_size):
+            sha1_hash.update(chunk)
+    return sha1_hash.hexdigest()
+
+
 """
 * Download Utilities
 """
@@ -137,8 +194,8 @@ def gh_download_file(
     """
     # Use provided header or choose one
     handler = handler or (
-        gh_request_handler if auth_token
-        else gh_request_handler_authenticated)
+        gh_request_handler_authenticated if auth_token
+        else gh_request_handler)
 
     @handler
     def _make_request():
@@ -146,7 +203,8 @@ def gh_download_file(
             url=url,
             path=path,
             header=gh_get_header(header, auth_token),
-            chunk_size=chunk_size)
+            chunk_size=chunk_size,
+            session=gh_session)
 
     # Download file
     _make_request()
@@ -179,27 +237,39 @@ def gh_download_repository(
     Returns:
         Path to the repository.
     """
-    # Establish base values
-    temp_file = path / 'temp.zip'
+    # Use provided header or choose one
+    handler = handler or (
+        gh_request_handler_authenticated if auth_token
+        else gh_request_handler)
     _repo_name = f'{repo}-{branch}'
+    _url = f'https://github.com/{user}/{repo}/archive/refs/heads/{branch}.zip'
 
-    # Download the archive
-    temp_file = gh_download_file(
-        url=f"https://github.com/{user}/{repo}/archive/refs/heads/{branch}.zip",
-        path=temp_file,
-        header=header,
-        auth_token=auth_token,
-        chunk_size=chunk_size,
-        handler=handler)
-
-    # Extract files, remove temporary zip
-    with zipfile.ZipFile(temp_file, 'r') as zf:
-        _repo_names = zf.namelist()
-        if _repo_names:
-            _repo_name = _repo_names[0].split('/')[0]
-        zf.extractall(path=path)
-    os.remove(temp_file)
-    return Path(path, _repo_name)
+    @handler
+    def _make_request() -> SpooledTemporaryFile:
+        """Stream the archive into a spooled file, only written to disk if the archive is large."""
+        _file = SpooledTemporaryFile(max_size=spool_size_default)
+        try:
+            with gh_session.get(
+                url=_url,
+                headers=gh_get_header(header, auth_token),
+                stream=True
+            ) as r:
+                r.raise_for_status()
+                for chunk in r.iter_content(chunk_size=chunk_size):
+                    _file.write(chunk)
+        except Exception:
+            _file.close()
+            raise
+        _file.seek(0)
+        return _file
+
+    # Download the archive and extract its files
+    with _make_request() as archive, zipfile.ZipFile(archive, 'r') as zf:
+        _members = zf.infolist()
+        if _members:
+            _repo_name = _members[0].filename.split('/', 1)[0]
+        zf.extractall(path=path, members=_members)
+    return path / _repo_name
 
 
 def gh_download_directory_files(
@@ -211,10 +281,15 @@ def gh_download_directory_files(
     header: dict | None = None,
     auth_token: Optional[str] = None,
     chunk_size: int = chunk_size_default,
-    handler: Optional[Callable] = None
+    handler: Optional[Callable] = None,
+    max_workers: int = 8
 ) -> list[Path]:
     """Download all files from a specific directory in a GitHub repository to a given path.
 
+    Notes:
+        Files which already exist at the given path are only downloaded if their size or git blob SHA differs
+            from the repository copy.
+
     Args:
         user: Username of the repository owner.
         repo: Name of the GitHub repository.
@@ -226,6 +301,7 @@ def gh_download_directory_files(
         chunk_size: Size of each chunk to write when using iter_content to save file.
         handler: Decorator function to handle retries, rate limits, etc. Uses built-in `request_handler_github`
             decorator if not provided.
+        max_workers: Maximum number of files to download concurrently, defaults to 8.
 
     returns:
         A list containing a Path to each file downloaded.
@@ -251,27 +327,44 @@ def gh_download_directory_files(
             f"URL: {url}")
         return files
 
-    # Download each file
+    def _download(_file: dict) -> Optional[Path]:
+        """Download a single file described by the GitHub API, returns None if the download failed."""
+        _path = Path(path, _file['name'])
+
+        # Skip files which already match the repository copy
+        try:
+            if _path.stat().st_size == _file.get('size') and gh_get_blob_sha(_path) == _file.get('sha'):
+                return _path
+        except OSError:
+            pass
+
+        try:
+            return gh_download_file(
+                url=_file['download_url'],
+                path=_path,
+                header=header,
+                chunk_size=chunk_size,
+                handler=handler)
+        except requests.RequestException:
+            # Couldn't download file
+            getLogger().warning(
+                f"Download failed: {_file['download_url']}")
+            return None
+
+    # Filter out directories and invalid file types
+    valid = []
     for file in data:
         # Is this a file?
-        if not all([bool(n in file) for n in ['type', 'name', 'download_url']]):
+        if 'type' not in file or 'name' not in file or 'download_url' not in file:
             continue
         # Is the filetype valid?
         if file['type'] != 'file' or (file_type and not file['name'].endswith(file_type)):
             continue
+        valid.append(file)
 
-        # Download file
-        try:
-            files.append(
-                gh_download_file(
-                    url=file['download_url'],
-                    path=Path(path, file['name']),
-                    header=header,
-                    chunk_size=chunk_size,
-                    handler=handler))
-        except requests.RequestException:
-            # Couldn't download file
-            getLogger().warning(
-                f"Download failed: {file['download_url']}")
-            continue
+    # Download each file concurrently, network I/O releases the GIL
+    if not valid:
+        return files
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(valid)))) as pool:
+        files.extend(n for n in pool.map(_download, valid) if n is not None)
     return files
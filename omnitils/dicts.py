@@ -5,6 +5,7 @@
 * LICENSE: Mozilla Public License 2.0
 """
 # Standard Library Imports
+from operator import itemgetter
 from typing import Hashable, Any
 
 """
@@ -39,7 +40,11 @@ def invert_map_multi(d: dict[Hashable, Hashable]) -> dict[Hashable, list[Hashabl
     """
     inverted = {}
     for k, v in d.items():
-        inverted.setdefault(v, []).append(k)
+        keys = inverted.get(v)
+        if keys is None:
+            inverted[v] = [k]
+            continue
+        keys.append(k)
     return inverted
 
 
@@ -71,7 +76,7 @@ def sort_by_value(d: dict, reverse: bool = False) -> dict:
     Returns:
         Value sorted dictionary.
     """
-    return dict(sorted(d.items(), key=lambda item: item[1], reverse=reverse))
+    return dict(sorted(d.items(), key=itemgetter(1), reverse=reverse))
 
 
 """
@@ -88,7 +93,8 @@ def next_item(d: dict) -> tuple[Hashable, Any]:
     Returns:
         Tuple containing key, value.
     """
-    return next(iter(d.items()))
+    key = next(iter(d))
+    return key, d[key]
 
 
 def last_item(d: dict) -> tuple[Hashable, Any]:
@@ -100,4 +106,5 @@ def last_item(d: dict) -> tuple[Hashable, Any]:
     Returns:
         Tuple containing key, value.
     """
-    return list(d.items())[-1]
+    key = next(reversed(d))
+    return key, d[key]
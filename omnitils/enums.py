@@ -6,7 +6,7 @@
 """
 # Standard Library Imports
 from enum import Enum, EnumMeta
-from typing import Iterator, Any
+from typing import Iterator, Any, Optional
 
 # Local Imports
 from omnitils.properties import default_prop
@@ -27,7 +27,13 @@ class ConstantMeta(EnumMeta):
 
     def __contains__(cls, item: Any) -> bool:
         """Check if item is contained in Enum collection."""
-        return bool(item in cls.__members__.values())
+        if isinstance(item, cls):
+            return True
+        try:
+            return item in cls._value2member_map_
+        except TypeError:
+            # Unhashable values aren't mapped
+            return any(item == n.value for n in cls.__members__.values())
 
     def items(cls) -> Iterator[tuple[str, Any]]:
         """Iterate over the names and values contained in the Enum collection."""
@@ -37,8 +43,8 @@ class ConstantMeta(EnumMeta):
     @default_prop
     def Default(cls) -> Any:
         """Allow for a 'default' Enum in the collection, overwrite this to manually define a default
-            value."""
-        return cls._value2member_map_.__iter__().__next__()
+            value. Returns None if the collection is empty."""
+        return next(iter(cls._value2member_map_), None)
 
 
 class StrConstantMeta(EnumMeta):
@@ -46,7 +52,10 @@ class StrConstantMeta(EnumMeta):
 
     def __contains__(cls, item: str) -> bool:
         """Check if item is contained in Enum collection."""
-        return bool(item in cls.__members__.values())
+        try:
+            return item in cls._value2member_map_
+        except TypeError:
+            return False
 
     def __iter__(cls) -> Iterator[str]:
         """Iterate over the Enum collection."""
@@ -59,10 +68,10 @@ class StrConstantMeta(EnumMeta):
             yield k, v.value
 
     @default_prop
-    def Default(cls) -> str:
+    def Default(cls) -> Optional[str]:
         """Allow for a 'default' Enum in the collection, overwrite this to manually define a default
-            value."""
-        return cls._value2member_map_.__iter__().__next__()
+            value. Returns None if the collection is empty."""
+        return next(iter(cls._value2member_map_), None)
 
 
 """
@@ -74,10 +83,5 @@ class StrConstant(str, Enum, metaclass=StrConstantMeta):
     """Enum constant where the value is always a string."""
 
     def __str__(self) -> str:
-        """Use cached value for string representation."""
-        return self.value
-
-    @default_prop
-    def value(self) -> str:
-        """Cache each value and cast as a string."""
-        return str(self._value_)
+        """Use value for string representation."""
+        return self._value_
@@ -5,7 +5,6 @@
 * LICENSE: Mozilla Public License 2.0
 """
 # Standard Library Imports
-from contextlib import suppress
 from logging import getLogger
 from typing import Callable, Any, Optional
 
@@ -31,8 +30,8 @@ def log_on_exception(logr: Any = None) -> Callable:
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                logr.log_exception(e)
-                raise e
+                logr.exception(e)
+                raise
         return wrapper
     return decorator
 
@@ -49,8 +48,9 @@ def return_on_exception(response: Optional[Any] = None) -> Callable:
     def decorator(func):
         def wrapper(*args, **kwargs):
             # Final exception catch
-            with suppress(Exception):
+            try:
                 return func(*args, **kwargs)
-            return response
+            except Exception:
+                return response
         return wrapper
     return decorator
@@ -10,13 +10,15 @@ from contextlib import suppress
 from typing import Union, Callable, Optional
 
 # Third Party Imports
-import requests
-from requests import Response
+from requests import Response, Session
 from requests.structures import CaseInsensitiveDict
 from yarl import URL
 
 # Local Imports
-from omnitils.fetch._core import request_header_default, chunk_size_default
+from omnitils.fetch._core import request_header_default, chunk_size_default, get_shared_session
+
+# Translation table which removes every non-digit ASCII character
+_NON_DIGITS = str.maketrans('', '', ''.join(chr(n) for n in range(128) if not chr(n).isdigit()))
 
 
 """
@@ -63,7 +65,11 @@ def estimate_content_length(response: Response, default: int = 0) -> int:
     total = response.headers.get('Content-Length', default)
     with suppress(Exception):
         if isinstance(total, str):
-            total = int(''.join(n for n in total if n.isdigit()) or default)
+            try:
+                total = int(total)
+            except ValueError:
+                # Strip anything that isn't a digit
+                total = int(total.translate(_NON_DIGITS) or default)
         if isinstance(total, int):
             return total
     return default
@@ -80,6 +86,7 @@ def download_file(
     header: Optional[dict] = None,
     callback: Optional[Callable] = None,
     chunk_size: int = chunk_size_default,
+    session: Optional[Session] = None,
 ) -> Union[str, os.PathLike]:
     """Download a file in chunks from url and save to path, executing a callback
         after each chunk if provided.
@@ -91,6 +98,8 @@ def download_file(
         callback: Callback to execute after each chunk is written. Passes
             number of bytes written (int) and number of bytes total (int).
         chunk_size: Chunk size in bytes to download while streaming the file.
+        session: Session object to make the request with, uses a shared cookie-less session if not
+            provided so connections are reused across downloads.
 
     Returns:
         Path to the saved file, if successful.
@@ -102,7 +111,8 @@ def download_file(
     has_callback = callback is not None
     header = header or request_header_default.copy()
     write_mode = 'ab' if check_resume_file(path, header) else 'wb'
-    with requests.get(url, headers=header, stream=True) as r:
+    session = session or get_shared_session()
+    with session.get(url, headers=header, stream=True) as r:
         r.raise_for_status()
 
         # Get file size total
@@ -110,14 +120,14 @@ def download_file(
 
         # Write the file in chunks
         with open(path, write_mode) as f:
+            current = f.tell()
             for chunk in r.iter_content(chunk_size=chunk_size):
                 if not chunk:
                     raise OSError('Bad chunk detected, likely a truncated stream!')
-                f.write(chunk)
+                current += f.write(chunk)
 
                 # Execute callback if provided
                 if has_callback:
-                    current = f.tell()
                     callback(current, max(current, total))
 
     # Return path
@@ -138,7 +148,7 @@ def download_file_from_response(
         path: Path to save the file to.
         callback: Optional callback to execute after each chunk is written. Passes
             number of bytes written (int) and number of bytes total (int).
-        chunk_size: Chunk size in bytes to download over each `iter_content` iteration, defaults to 8MB.
+        chunk_size: Chunk size in bytes to download over each `iter_content` iteration, defaults to 1MB.
 
     Returns:
         Path to the saved file, if successful.
@@ -156,15 +166,15 @@ def download_file_from_response(
 
     # Write the file in chunks
     with open(path, write_mode) as f:
+        current = f.tell()
         for chunk in response.iter_content(chunk_size=chunk_size):
             # Check for bad chunks
             if not chunk:
                 raise OSError('Bad chunk detected, likely a truncated stream!')
-            f.write(chunk)
+            current += f.write(chunk)
 
             # Execute callback if provided
             if has_callback:
-                current = f.tell()
                 callback(current, max(current, total))
 
     # Return path
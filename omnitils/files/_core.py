@@ -5,11 +5,16 @@
 * LICENSE: Mozilla Public License 2.0
 """
 # Standard Library Imports
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
+import mmap
 import os
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import Union
+from typing import Iterable, Optional, Union
+
+# Files larger than this are memory-mapped when hashed
+mmap_threshold_default = 1024 * 1024 * 8
 
 """
 * Generating Files
@@ -24,9 +29,12 @@ def ensure_file(path: Path, encoding: str = 'utf-8', boilerplate: str = '') -> N
         encoding: Encoding to use when opening the new file.
         boilerplate: Data to write to the new file.
     """
-    if path.is_file():
+    # Create the file only if it doesn't exist, in a single call
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    except FileExistsError:
         return
-    with open(path, 'w', encoding=encoding) as f:
+    with os.fdopen(fd, 'w', encoding=encoding) as f:
         f.write(boilerplate)
     return
 
@@ -47,12 +55,12 @@ def get_temporary_file(path: Path, ext: str = '.tmp', allow_existing: bool = Fal
     # Look for an existing file
     temp = path.with_suffix(ext)
     if allow_existing:
-        for p in os.listdir(path.parent):
-            file = path.parent / p
-            if file.is_dir() or os.path.samefile(file, path):
-                continue
-            if temp.name in file.name:
-                return file
+        with os.scandir(path.parent) as entries:
+            for entry in entries:
+                if entry.name == path.name or entry.is_dir():
+                    continue
+                if temp.name in entry.name:
+                    return Path(entry.path)
 
     # Create a new temporary file
     f = NamedTemporaryFile(prefix=temp.name, dir=temp.parent, delete=False)
@@ -77,11 +85,20 @@ def get_unique_filename(path: Path, increment_template: str = '({})') -> Path:
     Returns:
         A unique file path.
     """
-    stem, i = path.stem, 1
-    while path.is_file():
-        path = path.with_stem(f'{stem} {increment_template.format(i)}')
+    if not path.is_file():
+        return path
+
+    # Collect existing file names once, compare case-insensitively to stay safe on case-insensitive file systems
+    with os.scandir(path.parent) as entries:
+        existing = {n.name.casefold() for n in entries if n.is_file()}
+
+    # Build candidate names as strings, only create a Path for the final result
+    stem, suffix, i = path.stem, path.suffix, 1
+    name = f'{stem} {increment_template.format(i)}{suffix}'
+    while name.casefold() in existing:
         i += 1
-    return path
+        name = f'{stem} {increment_template.format(i)}{suffix}'
+    return path.with_name(name)
 
 
 """
@@ -102,9 +119,15 @@ def get_file_size_mb(file_path: Union[str, os.PathLike], decimal: int = 1) -> fl
     return round(os.path.getsize(file_path) / (1024 * 1024), decimal)
 
 
-def get_sha256(path: Path, chunk_size: int = 4096) -> str:
+def get_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
     """Calculate the SHA-256 hash of a file.
 
+    Notes:
+        Files larger than `mmap_threshold_default` are memory-mapped and hashed directly from the page
+            cache. Otherwise uses `hashlib.file_digest` when available (Python 3.11+), which reads the file
+            into a reusable buffer in C. The `chunk_size` argument only applies to the fallback loop on
+            older versions.
+
     Args:
         path: Path to the file.
         chunk_size: Max bytes to read from the file on each iteration.
@@ -112,8 +135,40 @@ def get_sha256(path: Path, chunk_size: int = 4096) -> str:
     Returns:
         The SHA-256 hash of this file.
     """
-    sha256_hash = hashlib.sha256()
     with open(path, "rb") as f:
-        for byte_block in iter(lambda: f.read(chunk_size), b""):
-            sha256_hash.update(byte_block)
+        if os.fstat(f.fileno()).st_size > mmap_threshold_default:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                return hashlib.sha256(mm).hexdigest()
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+
+        # Read into a single reusable buffer
+        sha256_hash = hashlib.sha256()
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while size := f.readinto(buffer):
+            sha256_hash.update(view[:size])
     return sha256_hash.hexdigest()
+
+
+def get_sha256_batch(paths: Iterable[Path], max_workers: Optional[int] = None) -> dict[Path, str]:
+    """Calculate the SHA-256 hash of multiple files concurrently.
+
+    Notes:
+        hashlib releases the GIL while hashing large buffers, so hashing in a thread pool lets reads
+            from one file overlap with hashing another.
+
+    Args:
+        paths: Paths to the files.
+        max_workers: Maximum number of threads to hash with, uses the executor default if not provided.
+
+    Returns:
+        A dictionary mapping each path to its SHA-256 hash.
+    """
+    paths = list(dict.fromkeys(paths))
+    if len(paths) < 2:
+        return {p: get_sha256(p) for p in paths}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(paths, pool.map(get_sha256, paths)))
@@ -3,9 +3,10 @@
 """
 # Standard Library
 import bz2
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from contextlib import suppress
+from functools import cache
 import gzip
-import gc
 import lzma
 import os
 from pathlib import Path
@@ -18,9 +19,6 @@ import zipfile
 
 # Third Party Imports
 from loguru import logger
-from tqdm import tqdm
-import py7zr
-from py7zr import SevenZipFile, FILTER_LZMA, FILTER_X86
 
 # Local Imports
 from omnitils.enums import StrConstant
@@ -29,6 +27,9 @@ from omnitils.strings import str_to_bool_safe
 # Locking mechanism
 ARCHIVE_LOCK = Lock()
 
+# Buffer size used when streaming data between files, default 16KB buffer makes far more read calls
+COPY_BUFFER_SIZE = 1024 * 1024
+
 """
 * Enums
 """
@@ -41,10 +42,11 @@ class ArchType(StrConstant):
     XZip = '.xz'
     BZip2 = '.bz2'
     SevenZip = '.7z'
+    Zstd = '.zst'
     TarGZip = '.tar.gz'
     TarXZip = '.tar.xz'
     TarBZip2 = '.tar.bz2'
-    TarSevenZip = '.tar.xz'
+    TarSevenZip = '.tar.7z'
 
 
 class WordSize(StrConstant):
@@ -79,6 +81,16 @@ class DictionarySize(StrConstant):
 """
 
 
+@cache
+def _use_7zip_env() -> bool:
+    """Check whether the 7-Zip CLI is enabled using the USE_7ZIP environment variable (string bool).
+
+    Notes:
+        The variable is only read once, changes made after the first compression won't take effect.
+    """
+    return str_to_bool_safe(os.environ.get('USE_7ZIP', '0'))
+
+
 def compress_7z_py(
     path_in: Path,
     path_out: Optional[Path] = None,
@@ -94,6 +106,9 @@ def compress_7z_py(
     Returns:
         Path to the resulting 7z archive if successful, otherwise None.
     """
+    # Imported on first use, py7zr is slow to import
+    from py7zr import SevenZipFile, FILTER_LZMA, FILTER_X86
+
     lzma_bcj = filters or [{'id': FILTER_X86}, {'id': FILTER_LZMA}]
     with SevenZipFile(path_out, 'w', filters=lzma_bcj) as z:
         z.write(path_in)
@@ -112,7 +127,8 @@ def compress_7z_7zip(
 
     Notes:
         Compressing using the 7-Zip CLI is relevantly faster than compressing with the py7zr
-            package, but required 7-Zip be installed on the host system.
+            package, but required 7-Zip be installed on the host system. Uses LZMA2 so the encoder
+            can make use of every core.
 
     Args:
         path_in: File to compress.
@@ -124,15 +140,14 @@ def compress_7z_7zip(
     Returns:
         Path to the resulting 7z archive if successful, otherwise None.
     """
-    null_device = open(os.devnull, 'w')
     subprocess.run([
-        "7z", "a", "-t7z", "-m0=LZMA",
+        "7z", "a", "-t7z", "-m0=LZMA2", "-mmt=on",
         f"-mx={compress_level}",
         f"-md={dict_size}M",
         f"-mfb={word_size}",
         str(path_out),
         str(path_in)
-    ], stdout=null_device, stderr=null_device)
+    ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     return path_out
 
 
@@ -150,7 +165,7 @@ def compress_7z(
         path_in: File to compress.
         path_out: Path to the archive to be saved. Use 'compressed' subdirectory if not provided.
         use_7zip: Whether to use the 7zip CLI to perform the compression, defaults to False. Can also be flagged
-            using the USE_7ZIP environment variable (string bool).
+            using the USE_7ZIP environment variable (string bool), which is read once per process.
         compress_level: Compression level to use (1 to 9). Only used with 7-Zip CLI, default is 9.
         word_size: Word size value to use for the compression. Only used with 7-Zip CLI, default is 16.
         dict_size: Dictionary size value to use for the compression. Only used with 7-Zip CLI, default is 1536.
@@ -166,7 +181,7 @@ def compress_7z(
     with suppress(Exception):
 
         # Compress with 7-Zip
-        if use_7zip or str_to_bool_safe(os.environ.get('USE_7ZIP', '0')):
+        if use_7zip or _use_7zip_env():
             return compress_7z_7zip(
                 path_in=path_in,
                 path_out=path_out,
@@ -183,20 +198,70 @@ def compress_7z(
     return logger.exception(f'Unable to compress file: {path_in.name}')
 
 
+def compress_zstd(
+    path_in: Path,
+    path_out: Optional[Path] = None,
+    level: int = 3,
+    threads: int = 0
+) -> Optional[Path]:
+    """Compress a target file and save it as a zstd archive to the output directory.
+
+    Notes:
+        Zstandard compresses and decompresses many times faster than LZMA at a slightly lower ratio, making
+            it the better choice for data that is frequently unpacked or already compressed (images, binaries).
+            Prefer 7z when archive size matters most, e.g. for cold storage.
+
+    Args:
+        path_in: File to compress.
+        path_out: Path to the archive to be saved. Use 'compressed' subdirectory if not provided.
+        level: Compression level to use (1 to 22), default is 3.
+        threads: Number of worker threads to compress with, default is 0 (compress in the calling thread).
+
+    Returns:
+        Path to the resulting zstd archive if successful, otherwise None.
+    """
+    # Imported on first use, pyzstd is installed alongside py7zr
+    import pyzstd
+
+    path_out = path_out or Path(path_in.parent, '.compressed', path_in.name)
+    path_out = path_out.with_name(path_out.name + ArchType.Zstd)
+    options: dict[int, int] = {
+        pyzstd.CParameter.compressionLevel: level,
+        pyzstd.CParameter.nbWorkers: threads}
+
+    # Compress the file
+    with suppress(Exception):
+        with open(path_in, 'rb') as fr, pyzstd.ZstdFile(path_out, 'wb', level_or_option=options) as fw:
+            shutil.copyfileobj(fr, fw, length=COPY_BUFFER_SIZE)  # noqa
+        return path_out
+
+    # Error occurred, None returned
+    return logger.exception(f'Unable to compress file: {path_in.name}')
+
+
 def compress_7z_all(
     path_in: Path,
     path_out: Path = None,
     word_size: WordSize = WordSize.WS16,
-    dict_size: DictionarySize = DictionarySize.DS1536
+    dict_size: DictionarySize = DictionarySize.DS1536,
+    workers: Optional[int] = None
 ) -> None:
     """Compress every file inside `path_in` directory as 7z archives, then output
     those archives in the `path_out`.
 
+    Notes:
+        Files are compressed in parallel across processes when using more than one worker. On platforms which
+            spawn new processes (Windows, macOS), the calling script must be guarded by
+            `if __name__ == '__main__':`.
+
     Args:
         path_in: Directory containing files to compress.
         path_out: Directory to place the archives. Use a subdirectory 'compressed' if not provided.
         word_size: Word size value to use for the compression.
         dict_size: Dictionary size value to use for the compression.
+        workers: Number of processes to compress files with. Defaults to the CPU count, or 1 if the
+            7-Zip CLI is enabled using the USE_7ZIP environment variable since it is already multithreaded
+            and uses a large amount of memory per file.
     """
     # Use "compressed" subdirectory if not provided, ensure output directory exists
     path_out = path_out or Path(path_in, '.compressed')
@@ -206,18 +271,44 @@ def compress_7z_all(
     files = [
         Path(path_in, n) for n in os.listdir(path_in)
         if Path(path_in, n).is_file()]
+    tasks = [(f, (path_out / f.name).with_suffix('.7z')) for f in files]
+
+    # Choose the number of workers
+    if workers is None:
+        workers = 1 if _use_7zip_env() else (os.cpu_count() or 1)
+    workers = max(1, min(workers, len(tasks)))
+
+    # Imported on first use, only needed for the progress bar
+    from tqdm import tqdm
 
-    # Compress each file
     with tqdm(total=len(files), desc="Compressing files", unit="file") as pbar:
-        for f in files:
-            p = (path_out / f.name).with_suffix('.7z')
-            pbar.set_description(f.name)
-            compress_7z(
-                path_in=f,
-                path_out=p,
-                word_size=word_size,
-                dict_size=dict_size)
-            pbar.update()
+
+        # Compress each file in this process
+        if workers == 1:
+            for f, p in tasks:
+                pbar.set_description(f.name)
+                compress_7z(
+                    path_in=f,
+                    path_out=p,
+                    word_size=word_size,
+                    dict_size=dict_size)
+                pbar.update()
+            return
+
+        # Compress files in parallel
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(
+                    compress_7z,
+                    path_in=f,
+                    path_out=p,
+                    word_size=word_size,
+                    dict_size=dict_size
+                ): f for f, p in tasks}
+            for future in as_completed(futures):
+                future.result()
+                pbar.set_description(futures[future].name)
+                pbar.update()
 
 
 """
@@ -225,6 +316,60 @@ def compress_7z_all(
 """
 
 
+@cache
+def _use_cli_env() -> bool:
+    """Check whether unpacking with installed archive CLIs (gzip, xz, bzip2, tar) is enabled using the
+        USE_ARCHIVE_CLI environment variable (string bool).
+
+    Notes:
+        The variable is only read once, changes made after the first unpack won't take effect.
+    """
+    return str_to_bool_safe(os.environ.get('USE_ARCHIVE_CLI', '0'))
+
+
+@cache
+def _find_cli(name: str) -> Optional[str]:
+    """Locate a command line utility on the system PATH.
+
+    Notes:
+        Lookups are cached, changes made to PATH after the first lookup won't take effect.
+
+    Args:
+        name: Name of the executable.
+
+    Returns:
+        Full path to the executable if found, otherwise None.
+    """
+    return shutil.which(name)
+
+
+def _run_cli(name: str, *args: str) -> bool:
+    """Run a command line archive utility, if it is installed on the host system.
+
+    Args:
+        name: Name of the executable.
+        *args: Arguments to pass to the executable.
+
+    Returns:
+        True if the utility was found and completed successfully, False if it isn't installed.
+
+    Raises:
+        OSError: If the utility couldn't be started or exited with an error.
+    """
+    exe = _find_cli(name)
+    if exe is None:
+        return False
+    result = subprocess.run(
+        [exe, *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise OSError(
+            f"'{name}' exited with code {result.returncode}:\n"
+            f"{result.stderr.decode(errors='replace').strip()}")
+    return True
+
+
 def unpack_zip(path: Path) -> None:
     """Unpack target 'zip' archive.
 
@@ -243,53 +388,78 @@ def unpack_zip(path: Path) -> None:
 def unpack_gz(path: Path) -> None:
     """Unpack target 'gz' archive.
 
+    Notes:
+        If the USE_ARCHIVE_CLI environment variable is enabled, uses the gzip CLI when it is installed on
+            the host system. Otherwise, uses the gzip module.
+
     Args:
         path: Path to the archive.
 
     Raises:
         FileNotFoundError: If archive couldn't be located.
+        OSError: If the gzip CLI was used and failed.
     """
     if not path.is_file():
         raise FileNotFoundError(f'Archive not found: {str(path)}')
+    if _use_cli_env() and _run_cli('gzip', '-d', '-k', '-f', str(path)):
+        return
     output = path.parent / path.name[:-3]
     with gzip.open(path) as fr, open(output, 'wb') as fw:
-        shutil.copyfileobj(fr, fw)  # noqa
+        shutil.copyfileobj(fr, fw, length=COPY_BUFFER_SIZE)  # noqa
 
 
 def unpack_xz(path: Path) -> None:
     """Unpack target 'xz' archive.
 
+    Notes:
+        If the USE_ARCHIVE_CLI environment variable is enabled, uses the xz CLI when it is installed on
+            the host system, which decodes multi-block archives across all cores. Otherwise, uses the
+            single-threaded lzma module.
+
     Args:
         path: Path to the archive.
 
     Raises:
         FileNotFoundError: If archive couldn't be located.
+        OSError: If the xz CLI was used and failed.
     """
     if not path.is_file():
         raise FileNotFoundError(f'Archive not found: {str(path)}')
+    if _use_cli_env() and _run_cli('xz', '-d', '-k', '-f', '-T0', str(path)):
+        return
     output = path.parent / path.name[:-3]
     with lzma.open(path) as fr, open(output, 'wb') as fw:
-        shutil.copyfileobj(fr, fw)  # noqa
+        shutil.copyfileobj(fr, fw, length=COPY_BUFFER_SIZE)  # noqa
 
 
 def unpack_bz2(path: Path) -> None:
     """Unpack target 'bz2' archive.
 
+    Notes:
+        If the USE_ARCHIVE_CLI environment variable is enabled, uses the pbzip2 or bzip2 CLI when either
+            is installed on the host system. Otherwise, uses the bz2 module.
+
     Args:
         path: Path to the archive.
 
     Raises:
         FileNotFoundError: If archive couldn't be located.
+        OSError: If a bzip2 CLI was used and failed.
     """
     if not path.is_file():
         raise FileNotFoundError(f'Archive not found: {str(path)}')
+    if _use_cli_env() and (
+        _run_cli('pbzip2', '-d', '-k', '-f', str(path)) or
+        _run_cli('bzip2', '-d', '-k', '-f', str(path))
+    ):
+        return
     output = path.parent / path.name[:-4]
     with bz2.open(path) as fr, open(output, mode='wb') as fw:
-        shutil.copyfileobj(fr, fw)  # noqa
+        shutil.copyfileobj(fr, fw, length=COPY_BUFFER_SIZE)  # noqa
 
 
-def unpack_7z(path: Path) -> None:
-    """Unpack target '7z' archive.
+def unpack_zst(path: Path) -> None:
+    """Unpack target 'zst' archive.
 
     Args:
         path: Path to the archive.
@@ -297,24 +467,99 @@ def unpack_7z(path: Path) -> None:
     Raises:
         FileNotFoundError: If archive couldn't be located.
     """
+    # Imported on first use, pyzstd is installed alongside py7zr
+    import pyzstd
+
     if not path.is_file():
         raise FileNotFoundError(f'Archive not found: {str(path)}')
-    with py7zr.SevenZipFile(path, 'r') as z:
+    output = path.parent / path.name[:-4]
+    with pyzstd.ZstdFile(path) as fr, open(output, mode='wb') as fw:
+        shutil.copyfileobj(fr, fw, length=COPY_BUFFER_SIZE)  # noqa
+
+
+def unpack_7z_7zip(path: Path) -> bool:
+    """Unpack target '7z' archive using the 7-Zip CLI.
+
+    Args:
+        path: Path to the archive.
+
+    Returns:
+        True if the archive was unpacked, False if 7-Zip isn't installed.
+
+    Raises:
+        OSError: If 7-Zip failed to unpack the archive.
+    """
+    args = ('x', '-y', f'-o{path.parent}', str(path))
+    return _run_cli('7z', *args) or _run_cli('7za', *args)
+
+
+def unpack_7z_py(path: Path, thread_lock: Optional[Lock] = None) -> None:
+    """Unpack target '7z' archive using the py7zr module.
+
+    Args:
+        path: Path to the archive.
+        thread_lock: Optional Lock object used to prevent concurrent unpacking with py7zr, will use
+            default Lock object if not provided.
+    """
+    # Imported on first use, py7zr is slow to import
+    from py7zr import SevenZipFile
+
+    with thread_lock or ARCHIVE_LOCK, SevenZipFile(path, 'r') as z:
         z.extractall(path=path.parent)
 
 
+def unpack_7z(path: Path, thread_lock: Optional[Lock] = None) -> None:
+    """Unpack target '7z' archive.
+
+    Notes:
+        If the USE_7ZIP environment variable is enabled, uses the 7-Zip CLI when it is installed on the
+            host system. Otherwise, uses py7zr.
+
+    Args:
+        path: Path to the archive.
+        thread_lock: Optional Lock object used to prevent concurrent unpacking when using py7zr, will
+            use default Lock object if not provided.
+
+    Raises:
+        FileNotFoundError: If archive couldn't be located.
+        OSError: If the 7-Zip CLI was used and failed.
+    """
+    if not path.is_file():
+        raise FileNotFoundError(f'Archive not found: {str(path)}')
+    if not (_use_7zip_env() and unpack_7z_7zip(path)):
+        unpack_7z_py(path, thread_lock=thread_lock)
+
+
+# Tar CLI compression flags for each tarfile mode
+_TAR_CLI_FLAGS: dict[str, tuple[str, ...]] = {
+    '': (),
+    'gz': ('-z',),
+    'xz': ('-J',),
+    'bz2': ('-j',)
+}
+
+
 def unpack_tar(path: Path, mode: str = 'gz'):
     """Unpack target 'tar' archive of a given type.
 
+    Notes:
+        If the USE_ARCHIVE_CLI environment variable is enabled, uses the tar CLI when it is installed on
+            the host system and supports the given mode. Otherwise, uses the tarfile module.
+
     Args:
         path: Path to the archive.
         mode: Mode to use when unpacking, i.e. type of archive it is (gz, xz, etc). Defaults to `gz`.
 
     Raises:
         FileNotFoundError: If archive couldn't be located.
+        OSError: If the tar CLI was used and failed.
     """
     if not path.is_file():
         raise FileNotFoundError(f'Archive not found: {str(path)}')
+    if _use_cli_env() and mode in _TAR_CLI_FLAGS and _run_cli(
+        'tar', '-x', *_TAR_CLI_FLAGS[mode], '-f', str(path), '-C', str(path.parent)
+    ):
+        return
     with tarfile.open(path, f'r:{mode}') as z:
         z.extractall(path=path.parent)
 
@@ -334,6 +579,38 @@ def unpack_tar_bz2(path: Path) -> None:
     unpack_tar(path, mode='bz2')
 
 
+# Unpack action for each archive type, suffixes checked longest first so 'tar.gz' matches before 'gz'
+_ACTION_MAP: dict[str, Callable] = {
+    ArchType.Zip: unpack_zip,
+    ArchType.GZip: unpack_gz,
+    ArchType.XZip: unpack_xz,
+    ArchType.BZip2: unpack_bz2,
+    ArchType.Zstd: unpack_zst,
+    ArchType.TarGZip: unpack_tar_gz,
+    ArchType.TarXZip: unpack_tar_xz,
+    ArchType.TarBZip2: unpack_tar_bz2,
+    ArchType.SevenZip: unpack_7z,
+    ArchType.TarSevenZip: unpack_7z
+}
+_ARCH_SUFFIXES = tuple(sorted(_ACTION_MAP, key=len, reverse=True))
+
+
+def _detect_arch(path: Path) -> Optional[str]:
+    """Detect the archive type of a path from its full extension.
+
+    Args:
+        path: Path to the archive.
+
+    Returns:
+        The matching archive extension, or None if not a recognized archive.
+    """
+    name = path.name.lower()
+    for suffix in _ARCH_SUFFIXES:
+        if name.endswith(suffix):
+            return suffix
+    return None
+
+
 def unpack_archive(path: Path, remove: bool = True, thread_lock: Optional[Lock] = None) -> None:
     """Unpack an archive using the correct methodology based on its extension.
 
@@ -341,27 +618,19 @@ def unpack_archive(path: Path, remove: bool = True, thread_lock: Optional[Lock]
         path: Path to the archive.
         remove: Whether to remove the archive after unpacking.
         thread_lock: Optional Lock object used to prevent concurrent unpacking, will use
-            default Lock object if not provided.
+            default Lock object if not provided. The lock only applies when falling back to py7zr,
+            other archive types are unpacked concurrently.
 
     Raises:
         FileNotFoundError: If archive couldn't be located.
     """
-    action_map: dict[str, Callable] = {
-        ArchType.Zip: unpack_zip,
-        ArchType.GZip: unpack_gz,
-        ArchType.XZip: unpack_xz,
-        ArchType.TarGZip: unpack_tar_gz,
-        ArchType.TarXZip: unpack_tar_xz,
-        ArchType.SevenZip: unpack_7z,
-        ArchType.TarSevenZip: unpack_7z
-    }
-    if path.suffix not in action_map:
+    arch = _detect_arch(path)
+    if arch is None:
         return
-    action = action_map[path.suffix]
-    if thread_lock is None:
-        thread_lock = ARCHIVE_LOCK
-    with thread_lock:
-        _ = action(path)
+    action = _ACTION_MAP[arch]
+    if action is unpack_7z:
+        action(path, thread_lock=thread_lock)
+    else:
+        action(path)
     if remove:
         os.remove(path)
-    gc.collect()
@@ -6,18 +6,32 @@
 """
 # Standard Library Imports
 import json
-from contextlib import suppress
+import os
 from pathlib import Path
-from typing import Optional, TypedDict, Callable, Union
+from typing import Any, Optional, TypedDict, Callable, Union
 from threading import Lock
+from weakref import WeakValueDictionary
 
 # Third Party Imports
 from yaml import (
     load as yaml_load,
-    dump as yaml_dump,
-    Loader as yamlLoader,
-    Dumper as yamlDumper)
-from tomlkit import dump as toml_dump, load as toml_load
+    dump as yaml_dump)
+try:
+    # Use LibYAML bindings if available
+    from yaml import CSafeLoader as yamlLoader, CSafeDumper as yamlDumper
+except ImportError:
+    from yaml import SafeLoader as yamlLoader, SafeDumper as yamlDumper
+from tomlkit import dump as toml_dump
+try:
+    # Use stdlib TOML parser if available (Python 3.11+)
+    import tomllib
+except ImportError:
+    import tomli as tomllib  # type: ignore[no-redef]
+try:
+    # Use orjson if available
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 """
 * Types
@@ -32,30 +46,130 @@ class DataFileType (TypedDict):
     dump_kw: dict[str, Union[Callable, bool, str]]
 
 
+class _YAMLDumper(yamlDumper):
+    """Safe YAML dumper which writes str and dict subclasses (e.g. StrConstant members) as plain
+        strings and mappings, so the output can be read back by the safe loader."""
+
+
+def _yaml_represent_str(dumper: _YAMLDumper, data: str):
+    """Represent a str subclass as its plain string value, the LibYAML emitter only accepts exact strings."""
+    return dumper.represent_str(str.__str__(data))
+
+
+_YAMLDumper.add_multi_representer(str, _yaml_represent_str)
+_YAMLDumper.add_multi_representer(dict, _YAMLDumper.represent_dict)
+
+
+def _json_load(f, **kwargs) -> Union[list, dict]:
+    """Load JSON data using orjson if available, falls back to the json module if orjson isn't installed,
+        json specific keyword arguments were provided, or orjson rejects the data (e.g. NaN or Infinity)."""
+    if orjson is None or kwargs:
+        return json.load(f, **kwargs)
+    text = f.read()
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
+def _toml_load(f, **kwargs) -> dict:
+    """Load TOML data using tomllib, which is far faster than tomlkit since it doesn't preserve formatting
+        for round-trips."""
+    return tomllib.loads(f.read(), **kwargs)
+
+
+def _yaml_load(f, **kwargs) -> Union[list, dict]:
+    """Load YAML data from the full contents of a file, so the parser scans one buffer instead of
+        calling back into Python to read each chunk of the stream."""
+    return yaml_load(f.read(), **kwargs)
+
+
+def _orjson_exact(obj: Union[list, dict, tuple]) -> bool:
+    """Check whether orjson will write an object exactly as the json module would. Only builtin JSON types
+        with string keys, 64-bit integers, and finite floats which the json module doesn't write in exponent
+        notation are accepted. Containers seen more than once are rejected, leaving circular references to
+        the json module's own error handling."""
+    stack: list[Any] = [obj]
+    seen: set[int] = set()
+    while stack:
+        o = stack.pop()
+        t = type(o)
+        if t is str or t is bool or o is None:
+            continue
+        if t is dict or t is list or t is tuple:
+            if id(o) in seen:
+                return False
+            seen.add(id(o))
+            if t is dict:
+                for k in o:
+                    if type(k) is not str:
+                        return False
+                stack.extend(o.values())
+            else:
+                stack.extend(o)
+        elif t is float:
+            # Also rejects NaN and Infinity
+            if o != 0 and not 1e-4 <= abs(o) < 1e16:
+                return False
+        elif t is int:
+            if not -2 ** 63 <= o < 2 ** 64:
+                return False
+        else:
+            return False
+    return True
+
+
+def _json_dump(
+    obj: Union[list, dict, tuple],
+    f,
+    sort_keys: bool = False,
+    indent: Optional[int] = None,
+    ensure_ascii: bool = True,
+    **kwargs
+) -> None:
+    """Dump JSON data using orjson if available and its output would be identical to the json module's,
+        otherwise falls back to the json module. This covers orjson not being installed, extra keyword
+        arguments, formatting orjson can't produce (ASCII escaping or an indent other than 2), and data
+        orjson would write differently (NaN/Infinity, exponent floats, integers wider than 64 bits)."""
+    if orjson is None or kwargs or ensure_ascii or indent not in (None, 2) or not _orjson_exact(obj):
+        return json.dump(obj, f, sort_keys=sort_keys, indent=indent, ensure_ascii=ensure_ascii, **kwargs)
+    option = 0
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    try:
+        data = orjson.dumps(obj, option=option)
+    except orjson.JSONEncodeError:
+        # E.g. nesting deeper than orjson supports
+        return json.dump(obj, f, sort_keys=sort_keys, indent=indent, ensure_ascii=ensure_ascii)
+    f.write(data.decode('utf-8'))
+
+
 """Data File: TOML (.toml) data type."""
 DataFileTOML = DataFileType(
-    load=toml_load,
+    load=_toml_load,
     dump=toml_dump,
     load_kw={},
     dump_kw={'sort_keys': True})
 
 """Data File: YAML (.yaml) data type."""
 DataFileYAML = DataFileType(
-    load=yaml_load,
+    load=_yaml_load,
     dump=yaml_dump,
     load_kw={
         'Loader': yamlLoader},
     dump_kw={
         'allow_unicode': True,
-        'Dumper': yamlDumper,
+        'Dumper': _YAMLDumper,
         'sort_keys': True,
         'indent': 2,
     })
 
 """Data File: JSON (.json) data type."""
 DataFileJSON = DataFileType(
-    load=json.load,
-    dump=json.dump,
+    load=_json_load,
+    dump=_json_dump,
     load_kw={},
     dump_kw={
         'sort_keys': True,
@@ -71,6 +185,9 @@ DataFileJSON = DataFileType(
 # File util locking mechanism
 util_file_lock = Lock()
 
+# Per file locks, held only while a given data file is being read or written
+_data_file_locks: WeakValueDictionary[str, Lock] = WeakValueDictionary()
+
 # Data types alias map
 data_types: dict[str, DataFileType] = {
     '.toml': DataFileTOML,
@@ -85,28 +202,54 @@ supported_data_types = tuple(data_types.keys())
 """
 
 
-def validate_data_type(path: Path) -> None:
+def _get_data_file_lock(path: Path) -> Lock:
+    """Get the Lock object guarding a specific data file, so different files can be accessed concurrently.
+
+    Args:
+        path: Path to the data file.
+
+    Returns:
+        Lock object shared by every caller accessing this data file.
+    """
+    key = os.fspath(path.resolve())
+    with util_file_lock:
+        lock = _data_file_locks.get(key)
+        if lock is None:
+            lock = _data_file_locks[key] = Lock()
+    return lock
+
+
+def validate_data_type(path: Path) -> DataFileType:
     """Checks if a data file matches a supported data file type.
 
     Args:
         path: Path to the data file.
 
+    Returns:
+        The data file type matching this file's extension.
+
     Raises:
         ValueError: If data file type not supported.
     """
-    # Check if data file is a supported data type
-    if path.suffix.lower() not in supported_data_types:
+    # Check if data file is a supported data type, try the exact suffix before normalizing it
+    suffix = path.suffix
+    parser = data_types.get(suffix) or data_types.get(suffix.lower())
+    if parser is None:
         raise ValueError("Data file provided does not match a supported data file type.\n"
                          f"Types supported: {', '.join(supported_data_types)}\n"
                          f"Type received: {path.suffix}")
+    return parser
 
 
-def validate_data_file(path: Path) -> None:
+def validate_data_file(path: Path) -> DataFileType:
     """Checks if a data file exists and is a valid data file type. Raises an exception if validation fails.
 
     Args:
         path: Path to the data file.
 
+    Returns:
+        The data file type matching this file's extension.
+
     Raises:
         FileNotFoundError: If data file does not exist.
         ValueError: If data file type not supported.
@@ -114,7 +257,7 @@ def validate_data_file(path: Path) -> None:
     # Check if file exists
     if not path.is_file():
         raise FileNotFoundError(f"Data file does not exist:\n{str(path)}")
-    validate_data_type(path)
+    return validate_data_type(path)
 
 
 def load_data_file(
@@ -135,19 +278,16 @@ def load_data_file(
         ValueError: If data file type not supported.
         OSError: If loading data file fails.
     """
-    # Check if data file is valid
-    validate_data_file(path)
-
-    # Pull the parser and insert user config into kwargs
-    parser: DataFileType = data_types.get(path.suffix.lower(), {}).copy()
-    if config:
-        parser['load_kw'].update(config)
+    # Check if data file is valid, pull the parser and insert user config into kwargs
+    parser: DataFileType = validate_data_file(path)
+    load_kw = {**parser['load_kw'], **config} if config else parser['load_kw']
 
     # Attempt to load data
-    with util_file_lock, suppress(Exception), open(path, 'r', encoding='utf-8') as f:
-        data = parser['load'](f, **parser['load_kw']) or {}
-        return data
-    raise OSError(f"Unable to load data from data file:\n{str(path)}")
+    try:
+        with _get_data_file_lock(path), open(path, 'r', encoding='utf-8') as f:
+            return parser['load'](f, **load_kw) or {}
+    except Exception as e:
+        raise OSError(f"Unable to load data from data file:\n{str(path)}") from e
 
 
 def dump_data_file(
@@ -167,19 +307,16 @@ def dump_data_file(
         ValueError: If data file type not supported.
         OSError: If dumping to data file fails.
     """
-    # Check if data file is valid
-    validate_data_type(path)
-
-    # Pull the parser and insert user config into kwargs
-    parser: DataFileType = data_types.get(path.suffix.lower(), {}).copy()
-    if config:
-        parser['dump_kw'].update(config)
+    # Check if data file is valid, pull the parser and insert user config into kwargs
+    parser: DataFileType = validate_data_type(path)
+    dump_kw = {**parser['dump_kw'], **config} if config else parser['dump_kw']
 
     # Attempt to dump data
-    with suppress(Exception), util_file_lock, open(path, 'w', encoding='utf-8') as f:
-        parser['dump'](obj, f, **parser['dump_kw'])
-        return
-    raise OSError(f"Unable to dump data to data file:\n{str(path)}")
+    try:
+        with _get_data_file_lock(path), open(path, 'w', encoding='utf-8') as f:
+            parser['dump'](obj, f, **dump_kw)
+    except Exception as e:
+        raise OSError(f"Unable to dump data to data file:\n{str(path)}") from e
 
 
 """
@@ -187,6 +324,15 @@ def dump_data_file(
 """
 
 
+def _dig(data: Any, *keys: str) -> Any:
+    """Walk down a chain of nested dictionary keys, returns None if any key along the way is missing."""
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
 def get_project_version(path: Path) -> str:
     """Returns the version string stored in the root project file.
 
@@ -194,7 +340,7 @@ def get_project_version(path: Path) -> str:
         path: Path to the root project file.
 
     Returns:
-        Current version string.
+        Current version string, read from `tool.poetry.version` or `project.version`. Defaults to 1.0.0.
 
     Raises:
         FileNotFoundError: If project file does not exist.
@@ -202,4 +348,5 @@ def get_project_version(path: Path) -> str:
         OSError: If project file fails to load.
     """
     project = load_data_file(path)
-    return project.get('tool', {}).get('poetry', {}).get('version', '1.0.0')
+    version = _dig(project, 'tool', 'poetry', 'version') or _dig(project, 'project', 'version')
+    return version if isinstance(version, str) else '1.0.0'
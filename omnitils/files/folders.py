@@ -6,9 +6,9 @@
 """
 # Standard Library Imports
 import os
-import random
 import shutil
 from pathlib import Path
+from tempfile import mkdtemp
 from typing import Iterator, Optional
 
 """
@@ -27,8 +27,13 @@ def mkdir_full_perms(path: Path) -> Path:
     """
     if path.is_dir():
         return path
-    os.umask(0)
-    path.mkdir(parents=True, exist_ok=True)
+
+    # Clear the umask only while creating the directory, it is process-wide state
+    umask = os.umask(0)
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+    finally:
+        os.umask(umask)
     return path
 
 
@@ -46,9 +51,17 @@ def get_subdirs(path: Path) -> Iterator[Path]:
     Yields:
         A subdirectory of the given folder.
     """
-    for dir_path, dir_names, filenames in os.walk(path):
-        for dirname in dir_names:
-            yield Path(dir_path) / dirname
+    # Walk top-down in the same order as os.walk, reusing the file type cached by each DirEntry
+    stack = [os.fspath(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                subdirs = [(n.path, n.is_symlink()) for n in entries if n.is_dir()]
+        except OSError:
+            continue
+        for sub, _ in subdirs:
+            yield Path(sub)
+        stack.extend(sub for sub, is_link in reversed(subdirs) if not is_link)
 
 
 def is_dir_empty(path: Path) -> bool:
@@ -90,20 +103,29 @@ def recur_move_dir(source: Path, target: Path, overwrite: bool = True) -> None:
         return
 
     # Check if target exists
-    if target.exists() and overwrite is False:
-        raise FileExistsError(f'{target} already exists!')
-    if not target.exists():
-        mkdir_full_perms(target)
+    if target.exists():
+        if overwrite is False:
+            raise FileExistsError(f'{target} already exists!')
+    else:
+        # Move the whole tree at once if possible, e.g. on the same file system
+        mkdir_full_perms(target.parent)
+        try:
+            os.rename(source, target)
+            return
+        except OSError:
+            mkdir_full_perms(target)
 
     # Iterate over items in the source directory
-    for src, dst in [(source / n, target / n) for n in os.listdir(source)]:
+    with os.scandir(source) as entries:
+        items = [(Path(n.path), target / n.name, n.is_dir()) for n in entries]
+    for src, dst, is_dir in items:
 
         # Check if destination exists
         if dst.exists() and overwrite is False:
             raise FileExistsError(f'{dst} already exists!')
 
         # Recurse down next directory or move file
-        func = recur_move_dir if src.is_dir() else shutil.move
+        func = recur_move_dir if is_dir else shutil.move
         func(src, dst)
 
     # Remove source directory if empty
@@ -132,14 +154,16 @@ def recur_move_contents(source: Path, target: Path, overwrite: bool = True) -> N
         mkdir_full_perms(target)
 
     # Move each item to target directory
-    for src, dst in [(source / n, target / n) for n in os.listdir(source)]:
+    with os.scandir(source) as entries:
+        items = [(Path(n.path), target / n.name, n.is_dir()) for n in entries]
+    for src, dst, is_dir in items:
 
         # Handle disallowed existing files
         if dst.exists() and not overwrite:
             raise FileExistsError(f'{dst} already exists!')
 
         # Move file or directory recursively
-        if src.is_dir():
+        if is_dir:
             recur_move_dir(src, dst, overwrite=overwrite)
             continue
         shutil.move(src, dst)
@@ -194,14 +218,15 @@ class DisposableDir:
         """A context manager that creates and returns a temporary directory inside a given path (defaults to current
             directory) and disposes of that directory after the manager closes.
 
+        Notes:
+            The directory's unique name (temp_<random>) is chosen atomically when the manager is entered, not
+                when it is initialized, so no path is known or held until then.
+
         Args:
             path: Path to create the disposable directory inside.
         """
-        path = (path or Path.cwd()) / 'temp'
-        name = path.name
-        while path.exists():
-            path = path.parent / f'{name}_{random.randint(1, 1000000)}'
-        self._dir = path
+        self._parent = path or Path.cwd()
+        self._dir: Optional[Path] = None
 
     def __enter__(self) -> Path:
         """Create the disposable directory.
@@ -209,7 +234,11 @@ class DisposableDir:
         Returns:
             Path to the disposable directory.
         """
-        mkdir_full_perms(self._dir)
+        mkdir_full_perms(self._parent)
+        self._dir = Path(mkdtemp(prefix='temp_', dir=self._parent))
+
+        # Match the full permissions of mkdir_full_perms, mkdtemp creates the directory owner-only
+        self._dir.chmod(0o777)
         return self._dir
 
     def __exit__(self, _exc_type, _exc_val, _exc_tb):
@@ -2,6 +2,7 @@
 * Utils: Images
 """
 # Standard Library Imports
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -142,19 +143,20 @@ def downscale_image(
 
     # Open the image, get dimensions
     with Image.open(path_img) as image:
+        width, height = image.size
+        size = (round(width * ratio), round(height * ratio))
+
+        # Let JPEG images decode at a reduced scale, at least twice the final size to preserve quality
+        if ratio < 100:
+            image.draft('RGB' if convert_rgb else None, (max(1, size[0] * 2), max(1, size[1] * 2)))
 
         # Convert to RGB
-        if convert_rgb:
-            image.convert('RGB')
+        if convert_rgb and image.mode != 'RGB':
+            image = image.convert('RGB')
 
         # Downscale
         if ratio < 100:
-            width, height = image.size
-            image.thumbnail(
-                size=(
-                    round(width * ratio),
-                    round(height * ratio)),
-                resample=resample)
+            image.thumbnail(size=size, resample=resample)
 
         # Save the new image
         try:
@@ -167,3 +169,30 @@ def downscale_image(
         except Exception as e:
             raise OSError("Couldn't downscale the provided image.") from e
         return path_save
+
+
+def downscale_images(
+    paths: list[Path],
+    max_workers: Optional[int] = None,
+    **kwargs
+) -> list[Path | None]:
+    """Downscale multiple images concurrently, Pillow releases the GIL while decoding, resizing, and encoding.
+
+    Args:
+        paths (list[Path]): Paths to each image.
+        max_workers (int): Maximum number of images to downscale at once, default: Executor default
+        **kwargs: Keyword arguments passed to `downscale_image` for each image, excluding `path_save`.
+
+    Returns:
+        List containing the Path to each downscaled image in the order provided, or None if an image couldn't
+            be downscaled or saved.
+    """
+    def _downscale(_path: Path) -> Path | None:
+        """Downscale a single image, returns None if the image couldn't be downscaled."""
+        try:
+            return downscale_image(path_img=_path, **kwargs)
+        except OSError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_downscale, paths))
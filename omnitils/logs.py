@@ -5,17 +5,35 @@
 * LICENSE: Mozilla Public License 2.0
 """
 # Standard Library Imports
-import copy
+from functools import lru_cache
+import re
 from typing import Any, Callable, Optional
 import sys
 
 # Third Party Imports
 from loguru import logger as loguru_logger
-from loguru._logger import Logger
+from loguru._logger import Core, Logger
+
+
+def _new_logger() -> Logger:
+    """Create a loguru logger object with its own core, independent of other logger objects. Constructed the
+        same way as loguru's global logger, which is far cheaper than deep copying an existing logger."""
+    return Logger(
+        core=Core(),
+        exception=None,
+        depth=0,
+        record=False,
+        lazy=False,
+        colors=False,
+        raw=False,
+        capture=True,
+        patchers=[],
+        extra={})
+
 
 # Reset the loguru logger
 loguru_logger.remove()
-logger = copy.deepcopy(loguru_logger)
+logger = _new_logger()
 
 """
 * Default Logging Definitions
@@ -30,6 +48,7 @@ COMPONENT_EXCEPTION = "<lr>{exception}</lr>"
 
 # Common tags
 TAGS_DEFAULT = ('<w>', '</w>')
+SEPARATOR_DEFAULT = ' <b>|</b> '
 
 # Pre-defined colors
 LEVEL_COLORS = {
@@ -59,27 +78,19 @@ LEVEL_COLORS = {
         pos=['lr'])
 }
 
-"""
-* Logging Handlers
-"""
 
 
-def colorize_log_format(log_fmt: str, log_level: str) -> str:
-    """An internal utility function called by a handler to colorize custom tags in a log format string.
+def get_level_tags(colors: dict[str, list]) -> dict[str, tuple[str, str]]:
+    """Builds the opening and closing color tags for each custom tag name in a level's color definitions.
 
     Args:
-        log_fmt: Log format string.
-        log_level: Level of current log to be formatted.
+        colors: Color definitions of a log level, see `LEVEL_COLORS`.
 
     Returns:
-        str: Colorized log format string.
+        A dictionary mapping each custom tag name to its opening and closing color tags.
     """
-
-    # Get log level colors
-    log_colors = LEVEL_COLORS.get(log_level) or LEVEL_COLORS['DEBUG']
-
-    # Replace each tag
-    for name, tag_group in log_colors.items():
+    tags: dict[str, tuple[str, str]] = {}
+    for name, tag_group in colors.items():
         left, right = '', ''
         for tag in tag_group:
 
@@ -96,10 +107,99 @@ def colorize_log_format(log_fmt: str, log_level: str) -> str:
             # One definition
             left += f'<{tag}>'
             right = f'</{tag}>{right}'
+        tags[name] = (left, right)
+    return tags
+
 
-        # Replace each opening and closing tag
-        log_fmt = log_fmt.replace(f'<{name}>', left).replace(f'</{name}>', right)
-    return log_fmt
+# Pre-built color tags for each level
+LEVEL_TAGS = {level: get_level_tags(colors) for level, colors in LEVEL_COLORS.items()}
+
+# Custom tag pattern and replacement for each matched tag, per level
+_RE_LEVEL_TAG = re.compile('</?(?:{})>'.format('|'.join(
+    re.escape(n) for n in dict.fromkeys(name for tags in LEVEL_TAGS.values() for name in tags))))
+_LEVEL_TAG_MAP = {
+    level: {
+        **{f'<{name}>': left for name, (left, _) in tags.items()},
+        **{f'</{name}>': right for name, (_, right) in tags.items()}
+    } for level, tags in LEVEL_TAGS.items()}
+_LEVEL_TAG_MAP_DEFAULT = _LEVEL_TAG_MAP['DEBUG']
+
+"""
+* Logging Handlers
+"""
+
+
+@lru_cache(maxsize=256)
+def colorize_log_format(log_fmt: str, log_level: str) -> str:
+    """An internal utility function called by a handler to colorize custom tags in a log format string.
+
+    Notes:
+        Uses the color tags pre-built from `LEVEL_COLORS` in `LEVEL_TAGS`, results are cached by format
+            and level.
+
+    Args:
+        log_fmt: Log format string.
+        log_level: Level of current log to be formatted.
+
+    Returns:
+        str: Colorized log format string.
+    """
+
+    # Replace each opening and closing tag in a single pass
+    tag_map = _LEVEL_TAG_MAP.get(log_level, _LEVEL_TAG_MAP_DEFAULT)
+    return _RE_LEVEL_TAG.sub(lambda m: tag_map.get(m.group(0), m.group(0)), log_fmt)
+
+
+@lru_cache(maxsize=256)
+def build_log_format(
+    level: str,
+    show_time: bool,
+    show_level: bool,
+    show_message: bool,
+    show_exception: bool,
+    separator: str,
+    main_tags: tuple[str, str],
+    terminator: str
+) -> str:
+    """An internal function which builds the complete format string for a given combination of log settings.
+        Results are cached, since only a handful of combinations are used in practice.
+
+    Args:
+        level: Level of current log to be formatted.
+        show_time: Whether to add the time component.
+        show_level: Whether to add the level component.
+        show_message: Whether to add the message component.
+        show_exception: Whether to add the exception component.
+        separator: Separator placed between each component.
+        main_tags: Opening and closing tags wrapped around the log format.
+        terminator: String placed at the end of the log format.
+
+    Returns:
+        str: Format to be used for logger output.
+    """
+    # Join the enabled components
+    parts = []
+    if show_time:
+        parts.append(COMPONENT_TIME)
+    if show_level:
+        parts.append(COMPONENT_LEVEL)
+    if show_message:
+        parts.append(COMPONENT_MESSAGE)
+    _fmt = separator.join(parts)
+
+    # Add exception on its own line
+    if show_exception:
+        _fmt = f'{_fmt}\n{COMPONENT_EXCEPTION}' if _fmt else COMPONENT_EXCEPTION
+
+    # Inject color tags, wrap, terminate, and return
+    _L, _R = main_tags
+    return _L + colorize_log_format(_fmt, level) + _R + terminator
+
+
+# Pre-built default formats for each level, used by most records
+_LEVEL_FORMATS_DEFAULT = {
+    level: build_log_format(level, True, True, True, False, SEPARATOR_DEFAULT, TAGS_DEFAULT, '\n')
+    for level in LEVEL_COLORS}
 
 
 def formatting_handler(record: dict[str, Any]) -> str:
@@ -114,62 +214,42 @@ def formatting_handler(record: dict[str, Any]) -> str:
 
     # Establish base values
     _level = record['level'].name
-    _extra = record.pop('extra', {})
-    _msg = record.get('message', '')
+    _extra = record.get('extra')
     _exception = record.get('exception')
-    _fmt = ''
+    _has_traceback = getattr(_exception, 'traceback', None) is not None
+
+    # No custom settings, use the default format
+    if not _extra:
+        if not _has_traceback and _level in _LEVEL_FORMATS_DEFAULT:
+            return _LEVEL_FORMATS_DEFAULT[_level]
+        return build_log_format(
+            _level, True, True, True, _has_traceback, SEPARATOR_DEFAULT, TAGS_DEFAULT, '\n')
 
     # Check if exception exists and should be shown
-    _main_tags = _extra.pop('main_tags', [])
-    _show_time = bool(_extra.pop('show_time', True))
-    _show_level = bool(_extra.pop('show_level', True))
-    _show_message = bool(_extra.pop('show_message', True))
-    _show_exception = bool(
-        _extra.pop('show_exception', True) and
-        hasattr(_exception, 'traceback') and
-        _exception.traceback is not None)
+    _main_tags = _extra.get('main_tags', [])
+    _show_time = bool(_extra.get('show_time', True))
+    _show_level = bool(_extra.get('show_level', True))
+    _show_message = bool(_extra.get('show_message', True))
+    _show_exception = bool(_extra.get('show_exception', True) and _has_traceback)
 
     # Check for alternate separator
-    _sep = _extra.pop('separator', ' <b>|</b> ')
+    _sep = _extra.get('separator', SEPARATOR_DEFAULT)
 
     # Check for a continuation line
     terminator = '\n'
     if not _show_exception:
-        if bool(_extra.pop('await_more', False)):
+        if bool(_extra.get('await_more', False)):
             terminator = ''
-        if bool(_extra.pop('add_more', False)):
+        if bool(_extra.get('add_more', False)):
             return colorize_log_format(COMPONENT_MESSAGE, _level) + terminator
 
-    def _add_component(_log_fmt, _component, _separator: Optional[str] = _sep) -> str:
-        """Adds a component to a provided log format, with a separator."""
-        if _log_fmt == '':
-            return _component
-        return _log_fmt + _separator + _component
-
-    def _wrap_main_tags(_log_fmt: str):
-        """Wraps the log format in the main surrounding tags."""
-        _L, _R = TAGS_DEFAULT
-        if _main_tags and isinstance(_main_tags, tuple) and len(_main_tags) == 2:
-            _L, _R = _main_tags
-        return _L + _log_fmt + _R + terminator
-
-    # Add time
-    if _show_time:
-        _fmt = _add_component(_fmt, COMPONENT_TIME)
-
-    # Add level
-    if _show_level:
-        _fmt = _add_component(_fmt, COMPONENT_LEVEL)
+    # Check for custom main tags
+    if not (_main_tags and isinstance(_main_tags, tuple) and len(_main_tags) == 2):
+        _main_tags = TAGS_DEFAULT
 
-    # Add message
-    if _show_message:
-        _fmt = _add_component(_fmt, COMPONENT_MESSAGE)
-
-    if _show_exception:
-        _fmt = _add_component(_fmt, COMPONENT_EXCEPTION, '\n')
-
-    # Inject color tags, wrap, terminate, and return
-    return _wrap_main_tags(colorize_log_format(_fmt, _level))
+    # Build the format, or pull it from cache
+    return build_log_format(
+        _level, _show_time, _show_level, _show_message, _show_exception, _sep, _main_tags, terminator)
 
 
 # Pre-defined handlers
@@ -211,15 +291,11 @@ def get_logger(handlers: Optional[list[dict[str, Any]]] = None, **kwargs) -> Log
     Returns:
         A unique loguru logger object.
     """
-    _logger: Logger = copy.deepcopy(loguru_logger)
-    _handlers: list[dict[str, Any]] = []
+    _logger: Logger = _new_logger()
 
     # Handlers provided
     if handlers is not None:
-        for n in handlers:
-            _base = HANDLER_DEFAULT.copy()
-            _base.update(n)
-            _handlers.append(_base)
+        _handlers = [{**HANDLER_DEFAULT, **n} for n in handlers]
         return reconfigure_logger(_logger, _handlers, **kwargs)
     return reconfigure_logger(_logger, **kwargs)
 
@@ -230,19 +306,17 @@ def get_logger(handlers: Optional[list[dict[str, Any]]] = None, **kwargs) -> Log
 
 
 class TemporaryLogger:
+    __slots__ = ('logger', '_handlers')
+
     def __init__(
         self,
         handlers: Optional[list[dict[str, Any]]] = None
     ):
-        self.logger: Logger = copy.deepcopy(loguru_logger)
-        self._handlers: list[dict[str, Any]] = []
+        self.logger: Logger = _new_logger()
         if handlers is not None:
-            for n in handlers:
-                _base = HANDLER_DEFAULT.copy()
-                _base.update(n)
-                self._handlers.append(_base)
+            self._handlers: list[dict[str, Any]] = [{**HANDLER_DEFAULT, **n} for n in handlers]
         else:
-            self._handlers.append(HANDLER_DEFAULT.copy())
+            self._handlers = [HANDLER_DEFAULT.copy()]
 
     def __enter__(self) -> Logger:
 
@@ -268,6 +342,7 @@ class LogResults:
         log_trace: Whether to log the traceback of any exception that occurs.
         log_obj: Logger object to use, defaults to the main omnitils logger.
     """
+    __slots__ = ('_on_failure', '_on_success', '_reraise', '_log_trace', '_logger')
 
     def __init__(
         self,
@@ -330,21 +405,27 @@ def log_test_result(
     Returns:
         Wrapped function.
     """
+    # Message logged with the traceback if no failure message provided
+    on_failure_trace = on_failure if on_failure is not None else 'The following exception occurred:'
+
     def decorator(func: Callable) -> Callable:
         def wrapper(*args, **kwargs):
             try:
-                with LogResults(
-                    on_success=on_success,
-                    on_failure=on_failure,
-                    reraise=True,
-                    log_trace=log_trace,
-                    log_obj=log_obj
-                ):
-                    return func(*args, **kwargs)
-            except Exception as e:
+                result = func(*args, **kwargs)
+            except Exception:
+                # Log error message and/or traceback
+                if log_trace:
+                    log_obj.exception(on_failure_trace)
+                elif on_failure:
+                    log_obj.error(on_failure)
                 if reraise:
-                    raise e
+                    raise
                 return on_failure_return
+
+            # Function executed without errors
+            if on_success:
+                log_obj.success(on_success)
+            return result
         return wrapper
     return decorator
 
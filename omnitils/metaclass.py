@@ -4,6 +4,8 @@
 * Copyright (c) Hexproof Systems <hexproofsystems@gmail.com>
 * LICENSE: Mozilla Public License 2.0
 """
+# Standard Library Imports
+from threading import RLock
 
 """
 * Meta-class Utils
@@ -12,9 +14,17 @@
 
 class Singleton(type):
     """Maintains a single instance of any child class to return for any subsequent calls."""
-    _instances: dict = {}
+    _lock = RLock()
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+        # Instance is stored on the class itself, checked without locking once created
+        try:
+            return cls.__dict__['__singleton_instance__']
+        except KeyError:
+            pass
+
+        # Create the instance, making sure only one thread does so
+        with Singleton._lock:
+            if '__singleton_instance__' not in cls.__dict__:
+                cls.__singleton_instance__ = super(Singleton, cls).__call__(*args, **kwargs)
+        return cls.__dict__['__singleton_instance__']
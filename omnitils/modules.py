@@ -41,9 +41,10 @@ def remove_python_path(path: Union[str, os.PathLike]) -> None:
     Args:
         path: Directory path to remove from `sys.path`.
     """
-    p = str(path)
-    if p in sys.path:
-        sys.path.remove(p)
+    try:
+        sys.path.remove(str(path))
+    except ValueError:
+        pass
 
 
 """
@@ -118,27 +119,29 @@ def import_nested_modules(
         A dictionary tree of modules imported.
     """
     ignored = ignored or []
+    skipped = frozenset(['__pycache__', *ignored])
     imported = {name: []}
-    for item in os.listdir(path):
-        if item in ['__pycache__', *ignored]:
-            continue
+    with os.scandir(path) as entries:
+        items = [(n.name, n.is_dir(), n.is_file()) for n in entries if n.name not in skipped]
+    for item, is_dir, is_file in items:
 
-        # Establish submodule path and name
-        p = path / item
-        n = '.'.join([name, p.stem])
+        # Establish submodule name
+        stem, suffix = os.path.splitext(item)
+        n = f'{name}.{stem}'
 
         # Nested folder or python file?
-        if p.is_dir() and recursive:
+        if is_dir and recursive:
             # Import directory
+            p = path / item
             add_python_path(str(p))
             module = import_nested_modules(
                 name=n, path=p, hotswap=hotswap, ignored=ignored)
             if module:
                 imported[n] = module
             remove_python_path(str(p))
-        elif p.is_file() and p.suffix == '.py':
+        elif is_file and suffix == '.py':
             # Import module
-            imported[n] = import_module_from_path(name=n, path=p, hotswap=hotswap)
+            imported[n] = import_module_from_path(name=n, path=path / item, hotswap=hotswap)
     return imported
 
 
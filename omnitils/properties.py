@@ -14,8 +14,7 @@ from typing import Callable
 
 def auto_prop(func: Callable) -> property:
     """Property decorator wrapper which automatically creates a setter."""
-    attr_type = func.__annotations__.get('return', str) if (
-        hasattr(func, '__annotations__')) else str
+    attr_type = func.__annotations__.get('return', str)
     auto_name = f"_{func.__name__}"
 
     def getter(self) -> attr_type:
@@ -37,8 +36,7 @@ def default_prop(func: Callable) -> property:
         - Allows the value to be changed later and caches the new value.
         - Allows the value to be deleted, which reroutes it to the default value.
     """
-    attr_type = func.__annotations__.get('return', str) if (
-        hasattr(func, '__annotations__')) else str
+    attr_type = func.__annotations__.get('return', str)
     cache_name = f"_{func.__name__}"
 
     def getter(self) -> attr_type:
@@ -56,8 +54,10 @@ def default_prop(func: Callable) -> property:
 
     def deleter(self) -> None:
         """Deleter for invalidating the property cache."""
-        if hasattr(self, cache_name):
+        try:
             delattr(self, cache_name)
+        except AttributeError:
+            pass
 
     # Return complete property
     return property(getter, setter, deleter, getattr(func, '__doc__', ''))
@@ -83,7 +83,6 @@ class tracked_prop:
             getter: Decorated method which acts as a getter for the property's default value.
         """
         self.getter = getter
-        self._value = None
         self._name = None
 
     def __get__(self, instance, owner):
@@ -96,9 +95,13 @@ class tracked_prop:
         Returns:
             Cached or default value.
         """
-        if self._value is None:
-            self._value = self.getter(instance)
-        return self._value
+        if instance is None:
+            return self
+        try:
+            return instance.__dict__[self._name]
+        except KeyError:
+            value = instance.__dict__[self._name] = self.getter(instance)
+            return value
 
     def __set__(self, instance, value) -> None:
         """Sets a new cached value for the decorated property and adds it to changes.
@@ -107,7 +110,7 @@ class tracked_prop:
             instance: Instance of the parent object.
             value: Value to set for the cached property.
         """
-        self._value = value
+        instance.__dict__[self._name] = value
         instance._changes.add(self._name)
         return
 
@@ -132,10 +135,10 @@ class tracked_prop:
         """
         self._name = name
 
-    def __delete__(self, owner):
+    def __delete__(self, instance):
         """Clears the cached value of the decorated property.
 
         Args:
-            owner: Class of the parent object.
+            instance: Instance of the parent object.
         """
-        self._value = None
+        instance.__dict__.pop(self._name, None)
@@ -8,7 +8,7 @@
 from typing import Any
 
 # Third Party Imports
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 """
 * Types
@@ -30,8 +30,7 @@ class Schema(BaseModel):
 class ArbitrarySchema(BaseModel):
     """Schema class allowing for arbitrary types."""
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
 class DictSchema(Schema):
@@ -47,5 +46,4 @@ class DictSchema(Schema):
 class ArbitraryDictSchema(DictSchema):
     """Dictionary schema class allowing for arbitrary types."""
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
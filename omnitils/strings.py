@@ -7,15 +7,25 @@
 # Standard Library Imports
 import codecs
 from datetime import datetime
+from functools import lru_cache
 import html
+import re
 import string
-from typing import Optional, Union
+from typing import Iterable, Optional, Union, TYPE_CHECKING
 import unicodedata
 from urllib import parse
 
-# Third Party Imports
-import yarl
-from dateutil import parser
+# Third Party Imports, imported on first use to keep module import fast
+if TYPE_CHECKING:
+    import yarl
+
+# Translation tables which strip punctuation (and optionally spaces) and lowercase ASCII letters
+_PUNCT_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase, string.punctuation)
+_PUNCT_SPACE_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase, string.punctuation + ' ')
+
+# Common complete date layouts, matched before falling back to the generic date parser
+_RE_DATE_YMD = re.compile(r'(\d{4})([-/.])(\d{1,2})\2(\d{1,2})')
+_RE_DATE_MDY = re.compile(r'(\d{1,2})([-/.])(\d{1,2})\2(\d{4})')
 
 # Maps strings to boolean values
 STR_BOOL_MAP = {
@@ -55,6 +65,9 @@ def str_to_bool(text: str) -> bool:
     Raises:
         ValueError: If string provided isn't a recognized truthy expression.
     """
+    value = STR_BOOL_MAP.get(text)
+    if value is not None:
+        return value
     try:
         return STR_BOOL_MAP[text.lower()]
     except KeyError:
@@ -63,10 +76,10 @@ def str_to_bool(text: str) -> bool:
 
 def str_to_bool_safe(text: str, default: bool = False) -> bool:
     """Shorthand for `str_to_bool` which returns default if exception is raised."""
-    try:
-        return STR_BOOL_MAP[text.lower()]
-    except KeyError:
-        return default
+    value = STR_BOOL_MAP.get(text)
+    if value is not None:
+        return value
+    return STR_BOOL_MAP.get(text.lower(), default)
 
 
 """
@@ -74,6 +87,24 @@ def str_to_bool_safe(text: str, default: bool = False) -> bool:
 """
 
 
+class _AlnumTable(dict):
+    """Translation table which maps non-alphanumeric characters to a replacement, filled lazily
+        as new characters are encountered by `str.translate`."""
+    __slots__ = ('replace_with',)
+
+    def __init__(self, replace_with: str):
+        super().__init__()
+        self.replace_with = ord(replace_with) if len(replace_with) == 1 else replace_with
+
+    def __missing__(self, key: int) -> Union[int, str]:
+        value = self[key] = key if chr(key).isalnum() else self.replace_with
+        return value
+
+
+# Cached alphanumeric translation tables, keyed by replacement string
+_ALNUM_TABLES: dict[str, _AlnumTable] = {}
+
+
 def str_to_alnum(text: str, replace_with: str = ' ') -> str:
     """Converts all characters that aren't alphanumeric to spaces or another provided character.
 
@@ -84,10 +115,10 @@ def str_to_alnum(text: str, replace_with: str = ' ') -> str:
     Return:
         Converted string.
     """
-    return ''.join([
-        n if n.isalnum() else replace_with
-        for n in text
-    ])
+    table = _ALNUM_TABLES.get(replace_with)
+    if table is None:
+        table = _ALNUM_TABLES[replace_with] = _AlnumTable(replace_with)
+    return text.translate(table)
 
 
 def normalize_str(text: str, no_space: bool = False) -> str:
@@ -100,14 +131,33 @@ def normalize_str(text: str, no_space: bool = False) -> str:
     Returns:
         Normalized string.
     """
-    # Ignore accents and unusual characters
-    st = unicodedata.normalize("NFD", text).encode("ascii", "ignore").decode("utf8")
+    # Ignore accents and unusual characters, ASCII strings are already normalized
+    st = text if text.isascii() else (
+        unicodedata.normalize("NFD", text).encode("ascii", "ignore").decode("utf8"))
+
+    # Remove punctuation (and spaces) and make lowercase in a single pass
+    if no_space:
+        return st.translate(_PUNCT_SPACE_TABLE)
+    return st.strip().translate(_PUNCT_TABLE)
 
-    # Remove spaces?
-    st = st.replace(' ', '') if no_space else st.strip()
 
-    # Remove punctuation and make lowercase
-    return st.translate(str.maketrans("", "", string.punctuation)).lower()
+def normalize_strs(texts: Iterable[str], no_space: bool = False) -> list[str]:
+    """Normalizes a batch of strings for safe comparison, see `normalize_str`.
+
+    Args:
+        texts: Strings to normalize.
+        no_space: If True remove all spaces, otherwise just leading and trailing spaces.
+
+    Returns:
+        List of normalized strings, in the same order.
+    """
+    table = _PUNCT_SPACE_TABLE if no_space else _PUNCT_TABLE
+    normalize = unicodedata.normalize
+    results = []
+    for text in texts:
+        st = text if text.isascii() else normalize("NFD", text).encode("ascii", "ignore").decode("utf8")
+        results.append(st.translate(table) if no_space else st.strip().translate(table))
+    return results
 
 
 def normalize_datestr(
@@ -126,6 +176,24 @@ def normalize_datestr(
     Returns:
         Normalized date string in the provided format.
     """
+    # Fast path for complete dates in a common layout
+    date_str = date_str.strip()
+    if match := _RE_DATE_YMD.fullmatch(date_str):
+        year, month, day = match.group(1, 3, 4)
+    elif match := _RE_DATE_MDY.fullmatch(date_str):
+        month, day, year = match.group(1, 3, 4)
+    if match:
+        try:
+            year, month, day = int(year), int(month), int(day)
+            return (date_default or datetime(year, month, day)).replace(
+                year=year, month=month, day=day).strftime(date_fmt)
+        except ValueError:
+            # Invalid or ambiguous values, defer to the parser
+            pass
+
+    # Imported on first use, dateutil is slow to import
+    from dateutil import parser
+
     # Replace any invalid integers
     items = [n.strip() for n in str_to_alnum(date_str).split(' ')]
     normalized = ' '.join(['1' if i.isnumeric() and 1 > int(i) else i for i in items])
@@ -148,6 +216,20 @@ def normalize_datestr(
         return datetime.today().strftime(date_fmt)
 
 
+class _VersionTable(dict):
+    """Translation table which removes every character except digits and periods, filled lazily
+        as new characters are encountered by `str.translate`."""
+    __slots__ = ()
+
+    def __missing__(self, key: int) -> Optional[int]:
+        value = self[key] = key if chr(key) in '.0123456789' else None
+        return value
+
+
+# Cached version string translation table
+_VERSION_TABLE = _VersionTable()
+
+
 def normalize_ver(st: str) -> str:
     """Normalize a version string for safe comparison.
 
@@ -157,7 +239,7 @@ def normalize_ver(st: str) -> str:
     Returns:
         Normalized version string.
     """
-    return ''.join([n for n in st if n in '.0123456789'])
+    return st.translate(_VERSION_TABLE)
 
 
 """
@@ -165,15 +247,22 @@ def normalize_ver(st: str) -> str:
 """
 
 
-def decode_url(url: str) -> yarl.URL:
+@lru_cache(1024)
+def decode_url(url: str) -> 'yarl.URL':
     """Unescapes and decodes a URL string and returns it as a URL object.
 
     Args:
         url: URL string to format.
 
+    Notes:
+        - Results are cached, returned URL objects are immutable and safe to share.
+
     Returns:
         Formatted URL object.
     """
+    # Imported on first use, yarl is slow to import
+    import yarl
+
     st = codecs.decode(
         html.unescape(parse.unquote(url)),
         'unicode_escape')
@@ -196,17 +285,37 @@ def is_multiline(text: Union[str, list[str]]) -> Union[bool, list[bool]]:
     """
     # String Given
     if isinstance(text, str):
-        if '\n' in text or '\r' in text:
-            return True
-        return False
+        return '\n' in text or '\r' in text
     # List Given
     if isinstance(text, list):
-        return [bool('\n' in t or '\r' in t) for t in text]
+        return ['\n' in t or '\r' in t for t in text]
     # Invalid data type provided
     raise Exception("Invalid type passed to 'is_multiline', can only accept a string or list of strings.\n"
                     f"Value received: {text}")
 
 
+def _find_nth(text: str, sep: str, n: int) -> int:
+    """Returns the index of the n-th single character separator in a string, or -1 if there are
+        fewer than n."""
+    idx = -1
+    for _ in range(n):
+        idx = text.find(sep, idx + 1)
+        if idx < 0:
+            return -1
+    return idx
+
+
+def _rfind_nth(text: str, sep: str, n: int) -> int:
+    """Returns the index of the n-th single character separator from the end of a string, or -1 if
+        there are fewer than n."""
+    idx = len(text)
+    for _ in range(n):
+        idx = text.rfind(sep, 0, idx)
+        if idx < 0:
+            return -1
+    return idx
+
+
 def strip_lines(text: str, num: int, sep: str = '\n') -> str:
     """Removes a number of leading or trailing lines from a multiline string.
 
@@ -220,9 +329,16 @@ def strip_lines(text: str, num: int, sep: str = '\n') -> str:
     """
     if num == 0:
         return text
+    if len(sep) != 1:
+        # Scanning from the end may not pick the same boundaries as split for separators that can overlap
+        return '\n'.join(text.split(sep)[:num] if num < 0 else text.split(sep)[num:])
     if num < 0:
-        return '\n'.join(text.split(sep)[:num])
-    return '\n'.join(text.split(sep)[num:])
+        idx = _rfind_nth(text, sep, -num)
+        st = text[:idx] if idx >= 0 else ''
+    else:
+        idx = _find_nth(text, sep, num)
+        st = text[idx + 1:] if idx >= 0 else ''
+    return st if sep == '\n' else st.replace(sep, '\n')
 
 
 def get_line(text: str, i: int, sep: str = '\n') -> str:
@@ -238,7 +354,23 @@ def get_line(text: str, i: int, sep: str = '\n') -> str:
     """
     if abs(i) > text.count('\n'):
         raise IndexError(f"Not enough lines in multiline string. Index of {i} is invalid.")
-    return text.split(sep)[i]
+    if len(sep) != 1:
+        # Scanning from the end may not pick the same boundaries as split for separators that can overlap
+        return text.split(sep)[i]
+
+    # Locate the line's boundaries without splitting the whole string
+    if i < 0:
+        end = _rfind_nth(text, sep, -i - 1) if i < -1 else len(text)
+        if end < 0:
+            raise IndexError(f"Not enough lines in multiline string. Index of {i} is invalid.")
+        start = text.rfind(sep, 0, end)
+        return text[start + 1:end] if start >= 0 else text[:end]
+    start = _find_nth(text, sep, i) if i > 0 else -1
+    if i > 0 and start < 0:
+        raise IndexError(f"Not enough lines in multiline string. Index of {i} is invalid.")
+    start += 1
+    end = text.find(sep, start)
+    return text[start:] if end < 0 else text[start:end]
 
 
 def get_lines(text: str, num: int, sep: str = '\n') -> str:
@@ -254,6 +386,13 @@ def get_lines(text: str, num: int, sep: str = '\n') -> str:
     """
     if num == 0 or abs(num) > text.count('\n') + 1:
         return text
+    if len(sep) != 1:
+        # Scanning from the end may not pick the same boundaries as split for separators that can overlap
+        return '\n'.join(text.split(sep)[num:] if num < 0 else text.split(sep)[:num])
     if num < 0:
-        return '\n'.join(text.split(sep)[num:])
-    return '\n'.join(text.split(sep)[:num])
+        idx = _rfind_nth(text, sep, -num)
+        st = text[idx + 1:] if idx >= 0 else text
+    else:
+        idx = _find_nth(text, sep, num)
+        st = text[:idx] if idx >= 0 else text
+    return st if sep == '\n' else st.replace(sep, '\n')
@@ -6,26 +6,32 @@
 """
 import functools
 # Standard Library Imports
-from time import perf_counter
+from array import array
+from dataclasses import dataclass, field
+import gc
+from math import sqrt
+from statistics import median
+from time import perf_counter_ns
 from typing import Optional, Callable, Any
 
 # Third Party
 from omnitils.logs import logger as _logger
 
-# Local Imports
-from omnitils.schema import Schema
-
 """
 * Types
 """
 
 
-class BenchmarkResult(Schema):
+@dataclass(slots=True)
+class BenchmarkResult:
     """Represents a benchmarking result."""
     value: Any
     average: float
-    times: list = []
     name: str
+    best: float = 0.0
+    median: float = 0.0
+    stdev: float = 0.0
+    times: array = field(default_factory=lambda: array('d'))
 
 
 """
@@ -48,7 +54,8 @@ class time_function:
     """
 
     def __init__(self, msg_or_func: Optional[str | Callable] = None, logger: Any = None):
-        self._func = None
+        self._func: Optional[Callable] = None
+        self._wrapper: Optional[Callable] = None
         self._msg = 'Function `{f}` completed in {t:.4f} seconds.'
         self._logger = logger or _logger
 
@@ -69,22 +76,43 @@ class time_function:
             Wrapped function.
         """
         is_wrapped: bool = bool(self._func is None)
-        _func: Callable = [*args].pop() if is_wrapped else self._func
-        _func_name: str = _func.__name__
+
+        # Decorator used without arguments, reuse the wrapper built on the first call
+        if not is_wrapped and self._wrapper is not None:
+            return self._wrapper(*args, **kw)
+
+        _func: Callable = [*args].pop() if self._func is None else self._func
+        _pc, _logger_obj = perf_counter_ns, self._logger
+
+        # Substitute plain {f} fields once, escaped braces or other {f} fields are formatted on each call
+        _msg = self._msg
+        _kw: dict[str, str] = {}
+        if '{{' in _msg or '{f!' in _msg or '{f:' in _msg:
+            _kw['f'] = _func.__name__
+        else:
+            _msg = _msg.replace('{f}', _func.__name__)
+
+        # Loguru formats the message itself, skipping it entirely when the level is filtered
+        if hasattr(_logger_obj, 'opt'):
+            _log = _logger_obj.opt(capture=False).info
+        else:
+            def _log(msg: str, **kw) -> None:
+                _logger_obj.info(msg.format(**kw))
 
         @functools.wraps(_func)
         def wrapper(*_args, **_kwargs):
             """Wrapped function."""
-            s = perf_counter()
+            s = _pc()
             result = _func(*_args, **_kwargs)
-            self._logger.info(
-                self._msg.format(
-                    f=_func_name,
-                    t=(perf_counter() - s)))
+            t = (_pc() - s) / 1e9
+            _log(_msg, t=t, **_kw)
             return result
 
         # Return result or wrapped function
-        return wrapper if is_wrapped else wrapper(*args, **kw)
+        if is_wrapped:
+            return wrapper
+        self._wrapper = wrapper
+        return wrapper(*args, **kw)
 
 
 """
@@ -92,21 +120,54 @@ class time_function:
 """
 
 
+def _autorange(func: Callable, args: tuple[Any, ...], target: float) -> int:
+    """Returns the number of consecutive calls to a function needed to span a target duration,
+        stepping through the same 1, 2, 5, 10, 20, 50, ... sequence as `timeit.Timer.autorange`.
+
+    Args:
+        func: Function to call.
+        args: Args to pass to the function.
+        target: Target duration in nanoseconds.
+
+    Returns:
+        Number of calls per timed sample.
+    """
+    i = 1
+    while True:
+        for j in (1, 2, 5):
+            number = i * j
+            s = perf_counter_ns()
+            for _ in range(number):
+                func(*args)
+            if perf_counter_ns() - s >= target:
+                return number
+        i *= 10
+
+
 def benchmark_funcs(
     funcs: list[tuple[Callable, list[Any]]],
     iterations: int = 1000,
     reset_func: Optional[Callable] = None,
-    logger: Any = None
+    logger: Any = None,
+    warmup: Optional[int] = None,
+    auto: bool = False
 ) -> None:
     """Test the execution time of a new function against an older function.
 
     Args:
-        funcs: List of tuples containing a func to test and args to pass to it.
+        funcs: List of tuples containing a func to test and args to pass to it. Args are copied into a
+            tuple before measuring, changes made to the original list during the run are not seen.
         iterations: Number of calls to each function to perform, must be higher than 1.
         reset_func: Optional function to call to reset app state between actions.
         logger: Logging object to use.
+        warmup: Number of untimed calls to each function before measuring, defaults to 1% of
+            iterations (at least 1). Use 0 to disable.
+        auto: If True, time each sample over a batch of consecutive calls sized so the whole run
+            spans at least 0.2 seconds, then report per-call times. Amortizes clock overhead for
+            very fast functions. Ignored if `reset_func` is provided.
     """
     logger = logger or _logger
+    warmup = max(1, iterations // 100) if warmup is None else warmup
 
     # Skip if no funcs provided
     if not funcs:
@@ -116,52 +177,92 @@ def benchmark_funcs(
 
     # Test configuration
     results: list[BenchmarkResult] = []
-    best: float = 0
+    _pc = perf_counter_ns
 
     # Test each function
     for func, args in funcs:
-        times, value = [], None
-
-        # Track the execution time across iterations
-        for i in range(iterations):
-            s = perf_counter()
-            try:
-                value = func(*args)
-            except Exception as e:
-                logger.error(f'Encountered an error in function "{func.__name__}"!')
-                return logger.exception(e)
-            times.append(perf_counter()-s)
-            if reset_func:
-                reset_func()
+        times, value = array('q', [0]) * iterations, None
+
+        # Unpacking a list builds a new tuple on every call, a tuple is passed through as-is
+        call_args = tuple(args)
+
+        # Keep cyclic garbage collection from pausing inside the measured calls
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            # Untimed calls to settle caches, lazy imports, and one-time setup
+            for _ in range(warmup):
+                func(*call_args)
+                if reset_func is not None:
+                    reset_func()
+
+            # Calls per timed sample
+            number = 1
+            if auto and reset_func is None:
+                number = _autorange(func, call_args, 2e8 / iterations)
+
+            # Track the execution time across iterations
+            if reset_func is None and number > 1:
+                batch = range(number)
+                for i in range(iterations):
+                    s = _pc()
+                    for _ in batch:
+                        value = func(*call_args)
+                    times[i] = _pc()-s
+            elif reset_func is None:
+                for i in range(iterations):
+                    s = _pc()
+                    value = func(*call_args)
+                    times[i] = _pc()-s
+            else:
+                # Reset app state between actions
+                for i in range(iterations):
+                    s = _pc()
+                    value = func(*call_args)
+                    times[i] = _pc()-s
+                    reset_func()
+        except Exception as e:
+            logger.error(f'Encountered an error in function "{func.__name__}"!')
+            return logger.exception(e)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        # Sample variance from exact integer sums, no cancellation error
+        total = sum(times)
+        variance = (iterations * sum(t * t for t in times) - total * total) / (
+            iterations * (iterations - 1)) if iterations > 1 else 0
 
         # Append result and value
         results.append(
             BenchmarkResult(
                 value=value,
-                average=sum(times)/len(times),
-                times=times,
+                average=total/iterations/number/1e9,
+                best=min(times)/number/1e9,
+                median=median(times)/number/1e9,
+                stdev=sqrt(variance)/number/1e9,
+                times=array('d', (t / number / 1e9 for t in times)),
                 name=func.__name__))
 
-    # Report results
-    for i, r in enumerate(sorted(results, key=lambda item: item.average)):
-
-        # Best result
-        if i == 0:
-            best = r.average
-            logger.success(f'{r.name}: {r.average}')
-            continue
-
-        # Slower results
-        pct_slower = round(((r.average - best) / ((r.average + best) / 2)) * 100, 2)
-        logger.warning(f"{r.name}: {r.average} ({pct_slower}% Slower)")
-
-    # Check if all values match
     if not results:
         return logger.warning('No results were found to compare.')
-    if all(n.value == results[0].value for n in results):
+
+    # Report best result, ranked by fastest call since the mean is skewed by outliers
+    ranked = sorted(results, key=lambda item: item.best)
+    best, first_value, identical = ranked[0].best, ranked[0].value, True
+    logger.success(f'{ranked[0].name}: {best} (median {ranked[0].median}, average {ranked[0].average})')
+
+    # Report slower results, checking if all values match along the way
+    for r in ranked[1:]:
+        pct_slower = round(((r.best - best) / ((r.best + best) / 2)) * 100, 2) if r.best else 0.0
+        logger.warning(
+            f"{r.name}: {r.best} (median {r.median}, average {r.average}) ({pct_slower}% Slower)")
+        identical = identical and r.value == first_value
+    if identical:
         return logger.success('Values are identical!')
 
     # Values don't match
     logger.error("Values don't appear to be identical! See values below.")
-    [logger.info(n.value) for n in results]
+    for n in results:
+        logger.info(n.value)
     return
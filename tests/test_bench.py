@@ -0,0 +1,28 @@
+"""
+* Tests: Benchmarking Utilities
+"""
+# Third Party Imports
+import pytest
+pytest.importorskip('loguru')
+
+# Local Imports
+from omnitils.test.bench import time_function
+
+
+class RecordingLogger:
+    """Logger without loguru's `opt`, records the last formatted message."""
+    message = None
+
+    def info(self, msg: str) -> None:
+        self.message = msg
+
+
+def timed() -> int:
+    return 1
+
+
+@pytest.mark.parametrize('msg', ['{f} in {t:.2f}', '{{f}} {f}', '{f!r} {t:.0f}', '{f:>10}', 'x{f}x{f}'])
+def test_time_function_message_matches_format(msg: str):
+    log = RecordingLogger()
+    assert time_function(msg, logger=log)(timed)() == 1
+    assert log.message == msg.format(f='timed', t=0.0)
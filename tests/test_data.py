@@ -0,0 +1,24 @@
+"""
+* Tests: Data File Utilities
+"""
+# Standard Library Imports
+from pathlib import Path
+
+# Third Party Imports
+import pytest
+pytest.importorskip('tomlkit')
+
+# Local Imports
+from omnitils.enums import StrConstant
+from omnitils.files.data import dump_data_file, load_data_file
+
+
+class Colors(StrConstant):
+    """String constant enum used as YAML data."""
+    Red = 'red'
+
+
+def test_yaml_round_trip_tuple_and_str_constant(tmp_path: Path):
+    path = tmp_path / 'data.yaml'
+    dump_data_file({'pair': (1, 2), 'color': Colors.Red}, path)
+    assert load_data_file(path) == {'pair': [1, 2], 'color': 'red'}
@@ -0,0 +1,24 @@
+"""
+* Tests: Google Drive Utilities
+"""
+# Third Party Imports
+import pytest
+pytest.importorskip('requests')
+pytest.importorskip('yarl')
+
+# Local Imports
+from omnitils.api.gdrive import gdrive_get_confirmation_url
+
+
+def test_confirmation_export_outranks_form():
+    contents = (
+        '<form id="download-form" action="https://drive.usercontent.google.com/download?id=form">\n'
+        '<a href="/uc?export=download&amp;id=export">Download</a>')
+    url = gdrive_get_confirmation_url(contents)
+    assert url.host == 'docs.google.com'
+    assert url.query['id'] == 'export'
+
+
+def test_confirmation_url_stops_at_line_end():
+    contents = '"downloadUrl":"https://drive.google.com/uc?id=json\n<p class="uc-error-subcaption">x</p>'
+    assert str(gdrive_get_confirmation_url(contents)) == 'https://drive.google.com/uc?id=json'
@@ -0,0 +1,32 @@
+"""
+* Tests: Schema Utilities
+"""
+# Standard Library Imports
+from typing import Optional
+
+# Third Party Imports
+import pytest
+pytest.importorskip('pydantic')
+
+# Local Imports
+from omnitils.schema import DictSchema
+
+
+class DefaultedSchema(DictSchema):
+    """Dict schema with only defaulted fields."""
+    x: int = 1
+    y: Optional[str] = None
+
+
+class RequiredSchema(DictSchema):
+    """Dict schema with a required field."""
+    x: int
+
+
+def test_dict_schema_defaulted_fields():
+    assert DefaultedSchema() == {'x': 1, 'y': None}
+    assert DefaultedSchema(y='a') == {'x': 1, 'y': 'a'}
+
+
+def test_dict_schema_required_fields():
+    assert RequiredSchema(x=5) == {'x': 5}
@@ -0,0 +1,25 @@
+"""
+* Tests: String Utilities
+"""
+# Third Party Imports
+import pytest
+
+# Local Imports
+from omnitils.strings import get_line, get_lines, strip_lines
+
+
+@pytest.mark.parametrize('text', ['a\nb\nc', '\na\n\nb\n', '|||||', 'a||b|||c||', 'a|\n|b\n|\n|c'])
+@pytest.mark.parametrize('sep', ['\n', '|', '||', '|\n|'])
+@pytest.mark.parametrize('num', [-4, -3, -2, -1, 1, 2, 3, 4])
+def test_lines_match_split(text: str, sep: str, num: int):
+    """Line helpers match the split based results, including separators that can overlap."""
+    parts = text.split(sep)
+    assert strip_lines(text, num, sep) == '\n'.join(parts[:num] if num < 0 else parts[num:])
+    if abs(num) <= text.count('\n') + 1:
+        assert get_lines(text, num, sep) == '\n'.join(parts[num:] if num < 0 else parts[:num])
+    if abs(num) <= text.count('\n') and -len(parts) <= num < len(parts):
+        assert get_line(text, num, sep) == parts[num]
+
+
+def test_strip_lines_overlapping_separator():
+    assert strip_lines('|||||', -1, '||') == '\n'.join('|||||'.split('||')[:-1])